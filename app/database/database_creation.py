@@ -4,6 +4,17 @@
 from contextlib import closing, contextmanager
 import sqlite3
 
+# --- Constants ---
+# indexes behind the gene sections lookups of the gene selection tab (name ->
+# indexed table and columns); the entity index also yields their GROUP BY order
+# (pubmed_id, passage_number)
+SECTIONS_INDEXES = {
+    "idx_annotations__entity_id__pubmed_id__passage_number":
+        "annotations (entity_id, pubmed_id, passage_number)",
+    "idx_annotations__accession": "annotations (accession)",
+    "idx_passages__pubmed_id__passage_number": "passages (pubmed_id, passage_number)",
+}
+
 # --- Public Functions ---
 # function to create a database
 
@@ -77,10 +88,39 @@ def create_database(db_path: str) -> None:
         )
     """)
 
+    for name, target in SECTIONS_INDEXES.items():
+        c.execute(f"CREATE INDEX {name} ON {target}")
+
     conn.commit()
     conn.close()
 
 
+def add_sections_indexes(db_path: str) -> list[str]:
+    """Add the missing indexes of the gene sections lookups to an existing database.
+
+    Databases created before these indexes existed do not have them. The file
+    is only written when an index is missing; the missing ones are created in
+    one transaction.
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+
+    Returns:
+        list[str]: Names of the indexes that were created.
+    """
+    with closing(sqlite3.connect(db_path)) as conn:
+        existing = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        missing = [name for name in SECTIONS_INDEXES if name not in existing]
+        if missing:
+            with conn:
+                conn.execute("BEGIN")
+                for name in missing:
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {name} ON {SECTIONS_INDEXES[name]}")
+    return missing
+
+
 def add_indexes_to_all_tables(
     db_path: str,
     *,
@@ -8,7 +8,7 @@ from typing import List, Tuple
 
 # --- Third Party Imports ---
 import pandas as pd
-from PyQt5.QtCore import QUrl
+from PyQt5.QtCore import Qt, QUrl
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import (
     QHBoxLayout,
@@ -586,25 +586,24 @@ class EnrichmentModuleView(QWidget):
         Returns:
             A list of lists, where each inner list represents a row's contents.
         """
+        model = self.genes_tab_stackwidget.get_gene_table_model()
+        columns = range(model.columnCount())
         row_contents: list[list[str]] = []
-        header = [self.gene_list_table.horizontalHeaderItem(
-            i).text() for i in range(self.gene_list_table.columnCount())]
+        header = [model.headerData(i, Qt.Horizontal) for i in columns]
         row_contents.append(header)
 
         # then add the marked rows (not the checked ones, but the marked ones)
-        for row in range(self.gene_list_table.rowCount()):
-            if self.gene_list_table.item(row, 0).background() == QColor(255, 255, 0):
-                row_content = [self.gene_list_table.item(row, col).text(
-                ) for col in range(self.gene_list_table.columnCount())]
+        for row in range(model.rowCount()):
+            if model.data(model.index(row, 0), Qt.BackgroundRole) == QColor(255, 255, 0):
+                row_content = [model.display_text(row, col) for col in columns]
                 row_contents.append(row_content)
 
         if len(row_contents) > 1:
             return row_contents
         else:
             # return all
-            for row in range(self.gene_list_table.rowCount()):
-                row_content = [self.gene_list_table.item(row, col).text(
-                ) for col in range(self.gene_list_table.columnCount())]
+            for row in range(model.rowCount()):
+                row_content = [model.display_text(row, col) for col in columns]
                 row_contents.append(row_content)
             return row_contents
 
@@ -2,12 +2,13 @@
 
 # --- Standard Library Imports ---
 import os
+from concurrent.futures import Future
 from datetime import datetime
 
 # --- Third Party Imports ---
 import numpy as np
 import pandas as pd
-from PyQt5.QtCore import QUrl
+from PyQt5.QtCore import QUrl, pyqtSignal
 from PyQt5.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -19,8 +20,8 @@ from PyQt5.QtWidgets import (
 
 # --- Local Imports ---
 from app.enrichment_module.enrichment_results.interactive_plot_creation import (
-    generate_interactive_bar_chart_html,
-    generate_interactive_bubble_chart_html,
+    generate_interactive_bar_chart_html_async,
+    generate_interactive_bubble_chart_html_async,
 )
 from app.util_widgets.clickable_widget import IconTextButton
 from app.util_widgets.svg_button import SvgHoverButton
@@ -31,6 +32,9 @@ from app.util_widgets.svg_button import SvgHoverButton
 class BubbleBarPlotWidget(QWidget):
     """Widget containing bubble plot and bar plot tabs for enrichment results."""
 
+    # (plot kind, output file, error message or "") - emitted from the chart generator thread
+    plot_generated = pyqtSignal(str, str, str)
+
     def __init__(self, dataframe: pd.DataFrame, main_app):
         """
         Initialize the BubbleBarPlotWidget.
@@ -55,6 +59,7 @@ class BubbleBarPlotWidget(QWidget):
 
         self.bubble_plot_html_path: str = None
         self.bar_plot_html_path: str = None
+        self.plot_generated.connect(self._on_plot_generated)
 
         # Create WebEngineViews for each tab
         self.bubble_tab = self.main_app.get_new_web_view()
@@ -182,19 +187,13 @@ class BubbleBarPlotWidget(QWidget):
         filename = f"bar_chart_{timestamp}.html"
         output_file = os.path.join(self.main_app.folder_path, filename)
 
-        # Generate the interactive bar chart HTML
-        generate_interactive_bar_chart_html(
+        # Generate the interactive bar chart HTML in the background; shown once written
+        future = generate_interactive_bar_chart_html_async(
             df=self.data,
             output_file=output_file
         )
-
-        # Load the bar chart in the correct tab
-        self.bar_tab.load(QUrl.fromLocalFile(output_file))
-        self.bar_tab.setZoomFactor(0.8)
-        self.bar_tab.show()
-
-        # Store the final HTML path
-        self.bar_plot_html_path = output_file
+        future.add_done_callback(
+            lambda f: self._emit_plot_generated("bar", output_file, f))
 
     def _update_bubble_plot(self) -> None:
         """Generate and display the bubble plot."""
@@ -205,18 +204,50 @@ class BubbleBarPlotWidget(QWidget):
         filename = f"bubble_chart_{timestamp}.html"
         output_file = os.path.join(self.main_app.folder_path, filename)
 
-        generate_interactive_bubble_chart_html(
+        future = generate_interactive_bubble_chart_html_async(
             df=self.data,
             output_file=output_file
         )
+        future.add_done_callback(
+            lambda f: self._emit_plot_generated("bubble", output_file, f))
+
+    def _emit_plot_generated(self, kind: str, output_file: str, future: Future) -> None:
+        """Forward a finished chart generation (called on the generator thread) to the UI thread.
+
+        Args:
+            kind (str): "bubble" or "bar".
+            output_file (str): Path of the generated HTML file.
+            future (Future): The finished generation future.
+        """
+        error = future.exception()
+        try:
+            self.plot_generated.emit(kind, output_file, "" if error is None else str(error))
+        except RuntimeError:
+            pass  # widget was deleted while the chart was being generated
 
-        # Load the bubble chart in the correct tab
-        self.bubble_tab.load(QUrl.fromLocalFile(output_file))
+    def _on_plot_generated(self, kind: str, output_file: str, error: str) -> None:
+        """Load a generated chart into its tab.
 
-        self.bubble_tab.setZoomFactor(0.8)
-        self.bubble_tab.show()
+        Args:
+            kind (str): "bubble" or "bar".
+            output_file (str): Path of the generated HTML file.
+            error (str): Error message if generation failed, otherwise empty.
+        """
+        if error:
+            self.main_app.add_log_line(
+                f"Failed to create {kind} plot: {error}", mode="ERROR")
+            return
 
-        self.bubble_plot_html_path = output_file
+        tab = self.bubble_tab if kind == "bubble" else self.bar_tab
+        tab.load(QUrl.fromLocalFile(output_file))
+        tab.setZoomFactor(0.8)
+        tab.show()
+
+        # Store the final HTML path
+        if kind == "bubble":
+            self.bubble_plot_html_path = output_file
+        else:
+            self.bar_plot_html_path = output_file
 
     def _export_plot(self) -> None:
         """Export the current plot (bubble or bar) to an HTML file."""
@@ -22,6 +22,9 @@ from PyQt5.QtWidgets import (
 )
 
 # --- Local Imports ---
+from app.enrichment_module.enrichment_results.numeric_enrichment_table_item import (
+    NumericEnrichmentTableWidgetItem,
+)
 from app.util_widgets.icon_line_edit import IconLineEdit
 from app.util_widgets.svg_button import SvgHoverButton
 from app.utils import get_default_html_svg, resource_path
@@ -32,17 +35,7 @@ class EnrichmentResultsWidget(QWidget):
     """Single-class widget: shows an HTML intro page or a sortable enrichment results table."""
 
     # --- small helper for numeric sorting in QTableWidget
-    class NumericTableWidgetItem(QTableWidgetItem):
-        """Custom QTableWidgetItem for numeric sorting."""
-
-        def __init__(self, value, display_text):
-            super().__init__(display_text)
-            self.value = value
-
-        def __lt__(self, other):
-            if isinstance(other, EnrichmentResultsWidget.NumericTableWidgetItem):
-                return self.value < other.value
-            return super().__lt__(other)
+    NumericTableWidgetItem = NumericEnrichmentTableWidgetItem
 
     PAGE_INIT = 0
     PAGE_TABLE = 1
@@ -57,6 +50,7 @@ class EnrichmentResultsWidget(QWidget):
         super().__init__()
         self.main_app = main_app
         self.dataframe = None  # processed df currently rendered
+        self._last_df_ref = None  # df object last passed to set_dataframe
 
         # ===== Layout & stacked pages =====
         root = QVBoxLayout(self)
@@ -151,6 +145,10 @@ class EnrichmentResultsWidget(QWidget):
             dataframe (pd.DataFrame | None): New dataframe to display, or None for no data
 
         """
+        # same object as the one already shown -> nothing to rebuild
+        if dataframe is not None and dataframe is self._last_df_ref:
+            return
+
         header = self.table.horizontalHeader()
         sort_col = header.sortIndicatorSection()
         sort_ord = header.sortIndicatorOrder()
@@ -185,6 +183,8 @@ class EnrichmentResultsWidget(QWidget):
                 if adj_p_col >= 0:
                     self.table.sortItems(adj_p_col, Qt.AscendingOrder)
 
+        self._last_df_ref = dataframe
+
         # swap stacked page
         self._update_view_state()
 
@@ -1,143 +1,147 @@
 """Provides functions to create interactive bubble and bar charts for enrichment results"""
 
 # --- Standard Library Imports ---
+import gzip
 import json
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from html import escape
+from string import Template
 
 # --- Third Party Imports ---
+import orjson
 import pandas as pd
 
-# --- Public Functions ---
-
-
-def generate_interactive_bubble_chart_html(
-    df: pd.DataFrame, output_file: str = "interactive_bubble_chart.html",
-    title: str = "Overrepresentation Analysis Bubble Chart", term_col: str = "Term"
-) -> None:
-    """
-    Enhanced interactive bubble chart with:
-      - Card UI
-      - Search + Top-N + sort controls
-      - Adjustable bubble min/max size
-      - Color scheme pickers (Viridis/Turbo/Cividis/Plasma/Magma)
-      - Export PNG/CSV buttons
-      - Responsive height based on Top N
-
-    Args:
-        df (pd.DataFrame): DataFrame containing enrichment results.
-        output_file (str): Path to save the generated HTML file.
-        title (str): Title of the plot.
-        term_col (str): Name of the column containing term names.
-
-    Returns:
-        None
-    """
-
-    df = df.copy()
-    if term_col not in df.columns:
-        raise ValueError(f"term_col '{term_col}' not found in DataFrame")
-
-    # Default set
-    candidates = [
-        "Overlap Count", "Total Genes", "Overlap Ratio", "-log10 P-value",
-        "-log10 Adjusted P-value", "Odds Ratio", "Combined Score", "Gene Count"
-    ]
-    # Filter columns
-    present_cols, numeric_cols = _filter_valid_columns(df, candidates)
-
-    if not present_cols:
-        # fallback: use all numeric columns + term
-        numeric_cols = [c for c in df.columns if c !=
-                        term_col and pd.api.types.is_numeric_dtype(df[c])]
-        present_cols = numeric_cols[:]
-
-    # Ensure JSON-safe
-    df = df.replace({pd.NA: None}).where(pd.notnull(df), None)
-    json_data = df.to_json(orient="records")
-    valid_columns_json = json.dumps(present_cols)
-    numeric_columns_json = json.dumps(numeric_cols)
-
-    # Unique ID for HTML element IDs
-    uid = uuid.uuid4().hex
-
-    # The following is the complete HTML content with embedded JavaScript for interactivity
-    html = f"""<!DOCTYPE html>
+# --- Constants ---
+# Stylesheet shared by the bubble and bar chart pages
+CHART_BASE_CSS = """
+:root {
+  --bg: #0b0c0f;
+  --card: #12151b;
+  --text: #e7eaf0;
+  --muted: #a5adba;
+  --border: #1f2430;
+  --ring: rgba(76,201,240,.35);
+  --shadow: 0 8px 24px rgba(0,0,0,.35);
+  --accent: #4cc9f0;
+}
+@media (prefers-color-scheme: light) {
+  :root {
+    --bg: #f8fafc;
+    --card: #ffffff;
+    --text: #0f172a;
+    --muted: #475569;
+    --border: #e2e8f0;
+    --ring: rgba(37,99,235,.25);
+    --shadow: 0 6px 18px rgba(15,23,42,.08);
+    --accent: #2563eb;
+  }
+}
+*{box-sizing:border-box}
+body{
+  margin:0; padding:20px; color:var(--text); background:
+  radial-gradient(900px 600px at 90% -10%, rgba(76,201,240,.10), transparent 60%),
+  radial-gradient(700px 600px at -10% 10%, rgba(124,58,237,.10), transparent 60%),
+  var(--bg);
+  font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial;
+}
+.header{
+  display:flex; justify-content:space-between; align-items:center; gap:12px; margin-bottom:14px;
+}
+h1{margin:0; font-size:15px}
+.pill{display:inline-flex; gap:8px; align-items:center; padding:8px 12px; border-radius:999px; border:1px solid var(--border); background:var(--card)}
+button.icon{border:1px solid var(--border); background:var(--card); color:var(--text); border-radius:8px; padding:6px 10px; cursor:pointer; box-shadow:var(--shadow)}
+button.icon:hover{box-shadow:0 0 0 4px var(--ring)}
+
+.layout{
+  display:grid; grid-template-columns: 320px 1fr; gap:18px;
+}
+@media (max-width: 900px){
+  .layout{grid-template-columns: 1fr}
+}
+
+.card{background:var(--card); border:1px solid var(--border); border-radius:16px; box-shadow:var(--shadow); overflow:hidden}
+.card .header-bar{padding:10px 12px; border-bottom:1px solid var(--border); display:flex; justify-content:space-between; align-items:center}
+.card .title{font-weight:700; font-size:14px}
+.card .body{padding:12px}
+
+.controls .group{display:flex; flex-direction:column; gap:6px; margin-bottom:10px}
+label{font-size:12px; color:var(--muted)}
+select, input[type="number"], input[type="search"]{
+  width:100%; padding:8px; border:1px solid var(--border); border-radius:10px; background:transparent; color:var(--text)
+}
+.row{display:flex; gap:8px}
+.helper{color:var(--muted); font-size:12px}
+
+.actions{display:flex; gap:8px; flex-wrap:wrap}
+.actions button{padding:6px 10px; border-radius:10px}
+
+.plot-wrap{min-height:420px}
+.mono{font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace}
+"""
+
+# DOM helpers shared by the bubble and bar chart scripts
+CHART_HELPERS_JS = """
+const q = (id) => document.getElementById(id);
+const populate = (sel, options) => {
+  sel.innerHTML = "";
+  options.forEach(v => {
+    const o = document.createElement("option");
+    o.value = v; o.textContent = v; sel.appendChild(o);
+  });
+};
+// Per-column Float64Array of +cols[key][i] || 0, built on first use and reused afterwards
+const columnCache = (cols, n) => {
+  const cache = {};
+  return (k) => {
+    if (!cache[k]) {
+      const src = cols[k] || [];
+      const a = new Float64Array(n);
+      for (let i = 0; i < n; i++) a[i] = +src[i] || 0;
+      cache[k] = a;
+    }
+    return cache[k];
+  };
+};
+// Run fn at most once per animation frame while the window is being resized
+const onResizeFrame = (fn) => {
+  let rafPending = false;
+  window.addEventListener("resize", () => {
+    if (rafPending) return;
+    rafPending = true;
+    requestAnimationFrame(() => { rafPending = false; fn(); });
+  });
+};
+// Delay fn until no call has happened for ms milliseconds
+const debounce = (fn, ms) => {
+  let t;
+  return (...a) => { clearTimeout(t); t = setTimeout(() => fn(...a), ms); };
+};
+// Call fn once, as soon as el scrolls into view (immediately if IntersectionObserver is missing)
+const whenVisible = (el, fn) => {
+  if (typeof IntersectionObserver === "undefined") { fn(); return; }
+  const io = new IntersectionObserver((entries) => {
+    if (entries.some(e => e.isIntersecting)) { io.disconnect(); fn(); }
+  });
+  io.observe(el);
+};
+"""
+
+# Chart pages, split around the embedded column data (see _write_html)
+BUBBLE_CHART_HEAD = Template("""<!DOCTYPE html>
     <html lang="en">
     <head>
     <meta charset="utf-8"/>
     <meta name="viewport" content="width=device-width,initial-scale=1"/>
-    <title>{escape(title)}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+    <title>$title_html</title>
+    <script src="https://cdn.plot.ly/plotly-gl2d-2.35.2.min.js"></script>
     <style>
-    :root {{
-      --bg: #0b0c0f;
-      --card: #12151b;
-      --text: #e7eaf0;
-      --muted: #a5adba;
-      --border: #1f2430;
-      --ring: rgba(76,201,240,.35);
-      --shadow: 0 8px 24px rgba(0,0,0,.35);
-      --accent: #4cc9f0;
-    }}
-    @media (prefers-color-scheme: light) {{
-      :root {{
-        --bg: #f8fafc;
-        --card: #ffffff;
-        --text: #0f172a;
-        --muted: #475569;
-        --border: #e2e8f0;
-        --ring: rgba(37,99,235,.25);
-        --shadow: 0 6px 18px rgba(15,23,42,.08);
-        --accent: #2563eb;
-      }}
-    }}
-    *{{box-sizing:border-box}}
-    body{{
-      margin:0; padding:20px; color:var(--text); background:
-      radial-gradient(900px 600px at 90% -10%, rgba(76,201,240,.10), transparent 60%),
-      radial-gradient(700px 600px at -10% 10%, rgba(124,58,237,.10), transparent 60%),
-      var(--bg);
-      font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial;
-    }}
-    .header{{
-      display:flex; justify-content:space-between; align-items:center; gap:12px; margin-bottom:14px;
-    }}
-    h1{{margin:0; font-size:15px}}
-    .pill{{display:inline-flex; gap:8px; align-items:center; padding:8px 12px; border-radius:999px; border:1px solid var(--border); background:var(--card)}}
-    button.icon{{border:1px solid var(--border); background:var(--card); color:var(--text); border-radius:8px; padding:6px 10px; cursor:pointer; box-shadow:var(--shadow)}}
-    button.icon:hover{{box-shadow:0 0 0 4px var(--ring)}}
-
-    .layout{{
-      display:grid; grid-template-columns: 320px 1fr; gap:18px;
-    }}
-    @media (max-width: 900px){{
-      .layout{{grid-template-columns: 1fr}}
-    }}
-
-    .card{{background:var(--card); border:1px solid var(--border); border-radius:16px; box-shadow:var(--shadow); overflow:hidden}}
-    .card .header-bar{{padding:10px 12px; border-bottom:1px solid var(--border); display:flex; justify-content:space-between; align-items:center}}
-    .card .title{{font-weight:700; font-size:14px}}
-    .card .body{{padding:12px}}
-
-    .controls .group{{display:flex; flex-direction:column; gap:6px; margin-bottom:10px}}
-    label{{font-size:12px; color:var(--muted)}}
-    select, input[type="number"], input[type="search"]{{
-      width:100%; padding:8px; border:1px solid var(--border); border-radius:10px; background:transparent; color:var(--text)
-    }}
-    .row{{display:flex; gap:8px}}
-    .helper{{color:var(--muted); font-size:12px}}
-
-    .actions{{display:flex; gap:8px; flex-wrap:wrap}}
-    .actions button{{padding:6px 10px; border-radius:10px}}
-
-    .plot-wrap{{min-height:420px}}
-    .mono{{font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace}}
+$base_css
     </style>
     </head>
     <body>
       <div class="header">
-        <h1>{escape(title)}</h1>
+        <h1>$title_html</h1>
       </div>
 
       <div class="layout">
@@ -145,29 +149,29 @@ def generate_interactive_bubble_chart_html(
           
           <div class="body controls">
             <div class="group">
-              <label for="search_{uid}">Search {escape(term_col)}</label>
-              <input type="search" id="search_{uid}" placeholder="type to filter...">
+              <label for="search_$uid">Search $term_col_html</label>
+              <input type="search" id="search_$uid" placeholder="type to filter...">
             </div>
 
             <div class="row">
               <div class="group" style="flex:1">
-                <label for="x_{uid}">X-Axis</label>
-                <select id="x_{uid}"></select>
+                <label for="x_$uid">X-Axis</label>
+                <select id="x_$uid"></select>
               </div>
               <div class="group" style="flex:1">
-                <label for="size_{uid}">Bubble Size</label>
-                <select id="size_{uid}"></select>
+                <label for="size_$uid">Bubble Size</label>
+                <select id="size_$uid"></select>
               </div>
             </div>
 
             <div class="row">
               <div class="group" style="flex:1">
-                <label for="color_{uid}">Color</label>
-                <select id="color_{uid}"></select>
+                <label for="color_$uid">Color</label>
+                <select id="color_$uid"></select>
               </div>
               <div class="group" style="flex:1">
-                <label for="scale_{uid}">Colorscale</label>
-                <select id="scale_{uid}">
+                <label for="scale_$uid">Colorscale</label>
+                <select id="scale_$uid">
                   <option value="Viridis">Viridis</option>
                   <option value="Turbo">Turbo</option>
                   <option value="Cividis">Cividis</option>
@@ -179,12 +183,12 @@ def generate_interactive_bubble_chart_html(
 
             <div class="row">
               <div class="group" style="flex:1">
-                <label for="sortby_{uid}">Sort By</label>
-                <select id="sortby_{uid}"></select>
+                <label for="sortby_$uid">Sort By</label>
+                <select id="sortby_$uid"></select>
               </div>
               <div class="group" style="flex:1">
-                <label for="order_{uid}">Sort Order</label>
-                <select id="order_{uid}">
+                <label for="order_$uid">Sort Order</label>
+                <select id="order_$uid">
                   <option value="desc">Descending</option>
                   <option value="asc">Ascending</option>
                 </select>
@@ -193,12 +197,12 @@ def generate_interactive_bubble_chart_html(
 
             <div class="row">
               <div class="group" style="flex:1">
-                <label for="top_{uid}">Top-N</label>
-                <input type="number" id="top_{uid}" min="1" value="20">
+                <label for="top_$uid">Top-N</label>
+                <input type="number" id="top_$uid" min="1" value="20">
               </div>
               <div class="group" style="flex:1">
-                <label for="ypos_{uid}">Y-Axis Order</label>
-                <select id="ypos_{uid}">
+                <label for="ypos_$uid">Y-Axis Order</label>
+                <select id="ypos_$uid">
                   <option value="top">Highest X on Top</option>
                   <option value="bottom">Highest X on Bottom</option>
                 </select>
@@ -207,12 +211,12 @@ def generate_interactive_bubble_chart_html(
 
             <div class="row">
               <div class="group" style="flex:1">
-                <label for="minsize_{uid}">Min Bubble Size</label>
-                <input type="number" id="minsize_{uid}" min="1" max="300" value="10">
+                <label for="minsize_$uid">Min Bubble Size</label>
+                <input type="number" id="minsize_$uid" min="1" max="300" value="10">
               </div>
               <div class="group" style="flex:1">
-                <label for="maxsize_{uid}">Max Bubble Size</label>
-                <input type="number" id="maxsize_{uid}" min="20" max="300" value="100">
+                <label for="maxsize_$uid">Max Bubble Size</label>
+                <input type="number" id="maxsize_$uid" min="20" max="300" value="100">
               </div>
             </div>
 
@@ -225,45 +229,39 @@ def generate_interactive_bubble_chart_html(
             <div class="title">Chart</div>
           </div>
           <div class="body plot-wrap">
-            <div id="bubble_{uid}" style="width:100%;height:100%"></div>
+            <div id="bubble_$uid" style="width:100%;height:100%"></div>
           </div>
         </div>
       </div>
 
     <script>
-    (function(){{
-      const RAW = {json_data};
-      const VALID = {valid_columns_json};
-      const NUMERIC = {numeric_columns_json};
-      const TERM = {json.dumps(term_col)};
+    (function(){
+      const COLS = """)
+BUBBLE_CHART_TAIL = Template(""";
+      const VALID = $valid_columns_json;
+      const NUMERIC = $numeric_columns_json;
+      const TERM = $term_col_json;
 
       
       
 
       // Controls
-      const q = (id) => document.getElementById(id);
-      const els = {{
-        search: q("search_{uid}"),
-        x: q("x_{uid}"),
-        size: q("size_{uid}"),
-        color: q("color_{uid}"),
-        scale: q("scale_{uid}"),
-        sortby: q("sortby_{uid}"),
-        order: q("order_{uid}"),
-        top: q("top_{uid}"),
-        ypos: q("ypos_{uid}"),
-        minsize: q("minsize_{uid}"),
-        maxsize: q("maxsize_{uid}"),
-        plot: q("bubble_{uid}")
-      }};
-
-      const populate = (sel, options) => {{
-        sel.innerHTML = "";
-        options.forEach(v => {{
-          const o = document.createElement("option");
-          o.value = v; o.textContent = v; sel.appendChild(o);
-        }});
-      }};
+$helpers_js
+      const els = {
+        search: q("search_$uid"),
+        x: q("x_$uid"),
+        size: q("size_$uid"),
+        color: q("color_$uid"),
+        scale: q("scale_$uid"),
+        sortby: q("sortby_$uid"),
+        order: q("order_$uid"),
+        top: q("top_$uid"),
+        ypos: q("ypos_$uid"),
+        minsize: q("minsize_$uid"),
+        maxsize: q("maxsize_$uid"),
+        plot: q("bubble_$uid")
+      };
+
       populate(els.x, NUMERIC.length ? NUMERIC : VALID);
       populate(els.size, NUMERIC.length ? NUMERIC : VALID);
       populate(els.color, VALID);
@@ -275,206 +273,138 @@ def generate_interactive_bubble_chart_html(
       if (VALID.includes("-log10 Adjusted P-value")) els.sortby.value = "-log10 Adjusted P-value";
 
 
-      const compute = () => {{
+      // COLS-derived values computed once; compute() only reads these caches
+      const N = COLS[TERM].length;
+      const TERMS_LC = COLS[TERM].map(t => (t ?? "").toString().toLowerCase());
+      const numCol = columnCache(COLS, N);
+      NUMERIC.forEach(k => numCol(k));
+
+      const compute = () => {
         const search = (els.search.value||"").trim().toLowerCase();
-        const sortBy = els.sortby.value;
         const asc = els.order.value === "asc";
         let top = parseInt(els.top.value, 10);
-        if (!Number.isFinite(top) || top <= 0) top = RAW.length;
+        if (!Number.isFinite(top) || top <= 0) top = N;
 
         // Filter by term
-        let rows = RAW.filter(r => {{
-          const t = (r[TERM] ?? "").toString().toLowerCase();
-          return !search || t.includes(search);
-        }});
-
-        // Stable sort (copy first)
-        rows = rows.slice().sort((a,b) => {{
-          const av = +a[sortBy] || 0;
-          const bv = +b[sortBy] || 0;
-          return asc ? av - bv : bv - av;
-        }});
+        const hits = [];
+        for (let i = 0; i < N; i++) {
+          if (!search || TERMS_LC[i].includes(search)) hits.push(i);
+        }
 
-        rows = rows.slice(0, Math.min(top, rows.length));
+        // Stable sort of row indices on the cached keys
+        const sk = numCol(els.sortby.value);
+        let idx = Uint32Array.from(hits);
+        idx.sort((i, j) => asc ? sk[i] - sk[j] : sk[j] - sk[i]);
+        idx = idx.subarray(0, Math.min(top, idx.length));
 
         // Y order based on X values
         const xKey = els.x.value;
+        const xk = numCol(xKey);
         const topMeans = els.ypos.value === "top";
-        rows.sort((a,b) => topMeans ? (+b[xKey]||0) - (+a[xKey]||0) : (+a[xKey]||0) - (+b[xKey]||0));
-
-        // Sizes normalization
-        const sizeKey = els.size.value;
-        const sizes = rows.map(r => +r[sizeKey] || 0);
-        const smin = Math.min(...sizes);
-        const smax = Math.max(...sizes, 1);
+        idx.sort((i, j) => topMeans ? xk[j] - xk[i] : xk[i] - xk[j]);
+
+        // Sizes normalization (single pass for min/max)
+        const n = idx.length;
+        const szk = numCol(els.size.value);
+        let smin = Infinity, smax = 1;
+        for (let k = 0; k < n; k++) {
+          const v = szk[idx[k]];
+          if (v < smin) smin = v;
+          if (v > smax) smax = v;
+        }
         const minS = Math.max(1, +els.minsize.value || 10);
         const maxS = Math.max(minS+1, +els.maxsize.value || 100);
-        const scaled = sizes.map(v => {{
-          return minS + (smax===smin ? 0.5 : (v - smin)/(smax - smin))*(maxS - minS);
-        }});
-
-        return {{
-          rows,
-          x: rows.map(r => r[xKey]),
-          y: rows.map(r => r[TERM]),
-          size: scaled,
-          color: rows.map(r => r[els.color.value]),
-        }};
-      }};
-
-      const render = () => {{
+
+        const xs = COLS[xKey] || [], ts = COLS[TERM], cs = COLS[els.color.value] || [];
+        const x = new Array(n), y = new Array(n);
+        const size = new Array(n), color = new Array(n);
+        for (let k = 0; k < n; k++) {
+          const i = idx[k];
+          x[k] = xs[i];
+          y[k] = ts[i];
+          color[k] = cs[i];
+          size[k] = minS + (smax===smin ? 0.5 : (szk[i] - smin)/(smax - smin))*(maxS - minS);
+        }
+
+        return { x, y, size, color };
+      };
+
+      let initialized = false;
+      const render = () => {
         const R = compute();
-        const layout = {{
-          title: {json.dumps(title)},
-          xaxis: {{ title: els.x.value }},
-          yaxis: {{ title: TERM, automargin: true }},
-          height: Math.max(420, 35 * (R.rows.length || 1)),
-          margin: {{l: 80, r: 30, t: 50, b: 50}},
+        const layout = {
+          title: $title_json,
+          xaxis: { title: els.x.value },
+          yaxis: { title: TERM, automargin: true },
+          height: Math.max(420, 35 * (R.y.length || 1)),
+          margin: {l: 80, r: 30, t: 50, b: 50},
           paper_bgcolor: "rgba(0,0,0,0)",
           plot_bgcolor: "rgba(0,0,0,0)"
-        }};
-        const trace = {{
-          type: "scatter",
+        };
+        const trace = {
+          type: "scattergl",
           mode: "markers",
           x: R.x,
           y: R.y,
-          marker: {{
+          marker: {
             size: R.size,
             color: R.color,
             colorscale: els.scale.value,
             showscale: true,
             sizemode: "diameter",
             opacity: 0.85,
-            line: {{width: 0.5, color: "rgba(0,0,0,0.35)"}}
-          }},
+            line: {width: 0.5, color: "rgba(0,0,0,0.35)"}
+          },
           hovertemplate:
-            TERM + ": %{{y}}<br>" +
-            els.x.value + ": %{{x}}<br>" +
-            els.size.value + " (size)" + ": %{{marker.size:.2f}}<extra></extra>"
-        }};
-        const config = {{
+            TERM + ": %{y}<br>" +
+            els.x.value + ": %{x}<br>" +
+            els.size.value + " (size)" + ": %{marker.size:.2f}<extra></extra>"
+        };
+        const config = {
           responsive: true,
           displaylogo: false,
           modeBarButtonsToRemove: ["autoScale2d", "toggleSpikelines"]
-        }};
-        Plotly.newPlot(els.plot, [trace], layout, config);
-      }};
-
-      // Wire events
-      ["input","change"].forEach(ev => {{
-        [els.search, els.x, els.size, els.color, els.scale, els.sortby, els.order, els.top, els.ypos, els.minsize, els.maxsize]
+        };
+        // first render builds the plot, later ones only diff trace/layout
+        if (!initialized) {
+          Plotly.newPlot(els.plot, [trace], layout, config);
+          initialized = true;
+        } else {
+          Plotly.react(els.plot, [trace], layout, config);
+        }
+      };
+
+      // Wire events (search is debounced, the other controls render immediately)
+      els.search.addEventListener("input", debounce(render, 120));
+      ["input","change"].forEach(ev => {
+        [els.x, els.size, els.color, els.scale, els.sortby, els.order, els.top, els.ypos, els.minsize, els.maxsize]
           .forEach(el => el.addEventListener(ev, render));
-      }});
+      });
 
 
-      // Initial render
-      render();
-      window.addEventListener("resize", () => Plotly.Plots.resize(els.plot));
-    }})();
+      // Initial render, deferred until the chart card is on screen
+      whenVisible(els.plot.parentElement, () => { if (!initialized) render(); });
+      onResizeFrame(() => { if (initialized) Plotly.Plots.resize(els.plot); });
+    })();
     </script>
     </body>
     </html>
-    """
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html)
-    print(f"Interactive bubble chart saved to {output_file}")
-
-
-def generate_interactive_bar_chart_html(
-    df: pd.DataFrame, output_file: str = "interactive_bubble_chart.html",
-    title: str = "Overrepresentation Analysis Bar Chart", term_col: str = "Term"
-) -> None:
-    """
-    Enhanced interactive bar chart with:
-      - Card UI
-      - Search + Top-N + sort controls
-      - Color scheme pickers (Viridis/Turbo/Cividis/Plasma/Magma)
-      - Export PNG/CSV buttons
-      - Responsive height based on Top N
+    """)
 
-    Args:
-        df (pd.DataFrame): DataFrame containing enrichment results.
-        output_file (str): Path to save the generated HTML file.
-        title (str): Title of the plot.
-        term_col (str): Name of the column containing term names.
-
-    Returns:
-        None
-    """
-
-    df = df.copy()
-    if term_col not in df.columns:
-        raise ValueError(f"term_col '{term_col}' not found in DataFrame")
-
-    candidates = [
-        "Overlap Count", "Total Genes", "Overlap Ratio", "-log10 P-value",
-        "-log10 Adjusted P-value", "Odds Ratio", "Combined Score", "Gene Count"
-    ]
-    present_cols, numeric_cols = _filter_valid_columns(df, candidates)
-    if not present_cols:
-        numeric_cols = [c for c in df.columns if c !=
-                        term_col and pd.api.types.is_numeric_dtype(df[c])]
-        present_cols = numeric_cols[:]
-
-    df = df.replace({pd.NA: None}).where(pd.notnull(df), None)
-    json_data = df.to_json(orient="records")
-    valid_columns_json = json.dumps(present_cols)
-    numeric_columns_json = json.dumps(numeric_cols)
-    uid = uuid.uuid4().hex
-
-    html = f"""<!DOCTYPE html>
+BAR_CHART_HEAD = Template("""<!DOCTYPE html>
   <html lang="en">
   <head>
   <meta charset="utf-8"/>
   <meta name="viewport" content="width=device-width,initial-scale=1"/>
-  <title>{escape(title)}</title>
-  <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+  <title>$title_html</title>
+  <script src="https://cdn.plot.ly/plotly-basic-2.35.2.min.js"></script>
   <style>
-  /* same base styles as bubble for consistency */
-  :root {{
-    --bg: #0b0c0f; --card: #12151b; --text: #e7eaf0; --muted: #a5adba; --border: #1f2430;
-    --ring: rgba(76,201,240,.35); --shadow: 0 8px 24px rgba(0,0,0,.35); --accent:#4cc9f0;
-  }}
-  @media (prefers-color-scheme: light) {{
-    :root {{
-      --bg: #f8fafc; --card: #ffffff; --text: #0f172a; --muted: #475569; --border: #e2e8f0;
-      --ring: rgba(37,99,235,.25); --shadow: 0 6px 18px rgba(15,23,42,.08); --accent:#2563eb;
-    }}
-  }}
-  *{{box-sizing:border-box}}
-  body{{margin:0; padding:20px; color:var(--text); background:
-    radial-gradient(900px 600px at 90% -10%, rgba(76,201,240,.10), transparent 60%),
-    radial-gradient(700px 600px at -10% 10%, rgba(124,58,237,.10), transparent 60%),
-    var(--bg);
-    font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial;
-  }}
-  .header{{display:flex; justify-content:space-between; align-items:center; gap:12px; margin-bottom:14px}}
-  h1{{margin:0; font-size:15px}}
-  .pill{{display:inline-flex; gap:8px; align-items:center; padding:8px 12px; border-radius:999px; border:1px solid var(--border); background:var(--card)}}
-  button.icon{{border:1px solid var(--border); background:var(--card); color:var(--text); border-radius:8px; padding:6px 10px; cursor:pointer; box-shadow:var(--shadow)}}
-  button.icon:hover{{box-shadow:0 0 0 4px var(--ring)}}
-
-  .layout{{display:grid; grid-template-columns: 320px 1fr; gap:18px}}
-  @media (max-width: 900px){{.layout{{grid-template-columns:1fr}}}}
-
-  .card{{background:var(--card); border:1px solid var(--border); border-radius:16px; box-shadow:var(--shadow); overflow:hidden}}
-  .card .header-bar{{padding:10px 12px; border-bottom:1px solid var(--border); display:flex; justify-content:space-between; align-items:center}}
-  .card .title{{font-weight:700; font-size:14px}}
-  .card .body{{padding:12px}}
-
-  .controls .group{{display:flex; flex-direction:column; gap:6px; margin-bottom:10px}}
-  label{{font-size:12px; color:var(--muted)}}
-  select, input[type="number"], input[type="search"]{{width:100%; padding:8px; border:1px solid var(--border); border-radius:10px; background:transparent; color:var(--text)}}
-  .row{{display:flex; gap:8px}}
-  .helper{{color:var(--muted); font-size:12px}}
-
-  .plot-wrap{{min-height:420px}}
+$base_css
   </style>
   </head>
   <body>
     <div class="header">
-      <h1>{escape(title)}</h1>
+      <h1>$title_html</h1>
     </div>
 
     <div class="layout">
@@ -482,25 +412,25 @@ def generate_interactive_bar_chart_html(
         
         <div class="body controls">
           <div class="group">
-            <label for="search_{uid}">Search {escape(term_col)}</label>
-            <input type="search" id="search_{uid}" placeholder="type to filter...">
+            <label for="search_$uid">Search $term_col_html</label>
+            <input type="search" id="search_$uid" placeholder="type to filter...">
           </div>
 
           <div class="row">
             <div class="group" style="flex:1">
-              <label for="x_{uid}">X-Axis</label>
-              <select id="x_{uid}"></select>
+              <label for="x_$uid">X-Axis</label>
+              <select id="x_$uid"></select>
             </div>
             <div class="group" style="flex:1">
-              <label for="color_{uid}">Color</label>
-              <select id="color_{uid}"></select>
+              <label for="color_$uid">Color</label>
+              <select id="color_$uid"></select>
             </div>
           </div>
 
           <div class="row">
             <div class="group" style="flex:1">
-              <label for="scale_{uid}">Colorscale</label>
-              <select id="scale_{uid}">
+              <label for="scale_$uid">Colorscale</label>
+              <select id="scale_$uid">
                 <option value="Viridis">Viridis</option>
                 <option value="Turbo">Turbo</option>
                 <option value="Cividis">Cividis</option>
@@ -509,29 +439,29 @@ def generate_interactive_bar_chart_html(
               </select>
             </div>
             <div class="group" style="flex:1">
-              <label for="sortby_{uid}">Sort By</label>
-              <select id="sortby_{uid}"></select>
+              <label for="sortby_$uid">Sort By</label>
+              <select id="sortby_$uid"></select>
             </div>
           </div>
 
           <div class="row">
             <div class="group" style="flex:1">
-              <label for="order_{uid}">Sort Order</label>
-              <select id="order_{uid}">
+              <label for="order_$uid">Sort Order</label>
+              <select id="order_$uid">
                 <option value="desc">Descending</option>
                 <option value="asc">Ascending</option>
               </select>
             </div>
             <div class="group" style="flex:1">
-              <label for="top_{uid}">Top-N</label>
-              <input type="number" id="top_{uid}" min="1" value="20">
+              <label for="top_$uid">Top-N</label>
+              <input type="number" id="top_$uid" min="1" value="20">
             </div>
           </div>
 
           <div class="row">
             <div class="group" style="flex:1">
-              <label for="ypos_{uid}">Y-Axis Order</label>
-              <select id="ypos_{uid}">
+              <label for="ypos_$uid">Y-Axis Order</label>
+              <select id="ypos_$uid">
                 <option value="top">Highest X on Top</option>
                 <option value="bottom">Highest X on Bottom</option>
               </select>
@@ -545,40 +475,34 @@ def generate_interactive_bar_chart_html(
       <div class="card">
         <div class="header-bar"><div class="title">Chart</div></div>
         <div class="body plot-wrap">
-          <div id="bar_{uid}" style="width:100%;height:100%"></div>
+          <div id="bar_$uid" style="width:100%;height:100%"></div>
         </div>
       </div>
     </div>
 
   <script>
-  (function(){{
-    const RAW = {json_data};
-    const VALID = {valid_columns_json};
-    const NUMERIC = {numeric_columns_json};
-    const TERM = {json.dumps(term_col)};
-
-
-
-    const q = (id)=>document.getElementById(id);
-    const els = {{
-      search: q("search_{uid}"),
-      x: q("x_{uid}"),
-      color: q("color_{uid}"),
-      scale: q("scale_{uid}"),
-      sortby: q("sortby_{uid}"),
-      order: q("order_{uid}"),
-      top: q("top_{uid}"),
-      ypos: q("ypos_{uid}"),
-      plot: q("bar_{uid}"),
-    }};
-
-    const populate = (sel, options) => {{
-      sel.innerHTML = "";
-      options.forEach(v => {{
-        const o = document.createElement("option");
-        o.value = v; o.textContent = v; sel.appendChild(o);
-      }});
-    }};
+  (function(){
+    const COLS = """)
+BAR_CHART_TAIL = Template(""";
+    const VALID = $valid_columns_json;
+    const NUMERIC = $numeric_columns_json;
+    const TERM = $term_col_json;
+
+
+
+$helpers_js
+    const els = {
+      search: q("search_$uid"),
+      x: q("x_$uid"),
+      color: q("color_$uid"),
+      scale: q("scale_$uid"),
+      sortby: q("sortby_$uid"),
+      order: q("order_$uid"),
+      top: q("top_$uid"),
+      ypos: q("ypos_$uid"),
+      plot: q("bar_$uid"),
+    };
+
     populate(els.x, NUMERIC.length ? NUMERIC : VALID);
     populate(els.color, VALID);
     populate(els.sortby, VALID);
@@ -587,91 +511,387 @@ def generate_interactive_bar_chart_html(
     if (VALID.includes("-log10 Adjusted P-value")) els.sortby.value = "-log10 Adjusted P-value";
 
 
-    const compute = () => {{
+    // COLS-derived values computed once; compute() only reads these caches
+    const N = COLS[TERM].length;
+    const TERMS_LC = COLS[TERM].map(t => (t ?? "").toString().toLowerCase());
+    const numCol = columnCache(COLS, N);
+    NUMERIC.forEach(k => numCol(k));
+
+    const compute = () => {
       const search = (els.search.value||"").trim().toLowerCase();
-      const sortBy = els.sortby.value;
       const asc = els.order.value === "asc";
       let top = parseInt(els.top.value, 10);
-      if (!Number.isFinite(top) || top <= 0) top = RAW.length;
+      if (!Number.isFinite(top) || top <= 0) top = N;
 
       // Filter by term
-      let rows = RAW.filter(r => {{
-        const t = (r[TERM] ?? "").toString().toLowerCase();
-        return !search || t.includes(search);
-      }});
-
-      // Sort then slice
-      rows = rows.slice().sort((a,b) => {{
-        const av = +a[sortBy] || 0;
-        const bv = +b[sortBy] || 0;
-        return asc ? av - bv : bv - av;
-      }}).slice(0, Math.min(top, rows.length));
+      const hits = [];
+      for (let i = 0; i < N; i++) {
+        if (!search || TERMS_LC[i].includes(search)) hits.push(i);
+      }
+
+      // Sort row indices on the cached keys, then slice
+      const sk = numCol(els.sortby.value);
+      let idx = Uint32Array.from(hits);
+      idx.sort((i, j) => asc ? sk[i] - sk[j] : sk[j] - sk[i]);
+      idx = idx.subarray(0, Math.min(top, idx.length));
 
       // Order by X for y-axis placement
       const xKey = els.x.value;
+      const xk = numCol(xKey);
       const topMeans = els.ypos.value === "top";
-      rows.sort((a,b) => topMeans ? (+b[xKey]||0) - (+a[xKey]||0) : (+a[xKey]||0) - (+b[xKey]||0));
-
-      return {{
-        rows,
-        x: rows.map(r => r[xKey]),
-        y: rows.map(r => r[TERM]),
-        c: rows.map(r => r[els.color.value])
-      }};
-    }};
-
-    const render = () => {{
+      idx.sort((i, j) => topMeans ? xk[j] - xk[i] : xk[i] - xk[j]);
+
+      const xs = COLS[xKey] || [], ts = COLS[TERM], cs = COLS[els.color.value] || [];
+      return {
+        x: Array.from(idx, i => xs[i]),
+        y: Array.from(idx, i => ts[i]),
+        c: Array.from(idx, i => cs[i])
+      };
+    };
+
+    let initialized = false;
+    const render = () => {
       const R = compute();
-      const layout = {{
-        title: {json.dumps(title)},
-        xaxis: {{ title: els.x.value }},
-        yaxis: {{ title: TERM, automargin: true }},
-        margin: {{l: 100, r: 30, t: 50, b: 50}},
+      const layout = {
+        title: $title_json,
+        xaxis: { title: els.x.value },
+        yaxis: { title: TERM, automargin: true },
+        margin: {l: 100, r: 30, t: 50, b: 50},
         height: Math.max(420, 30 * (R.y.length || 1)),
         paper_bgcolor: "rgba(0,0,0,0)",
         plot_bgcolor: "rgba(0,0,0,0)"
-      }};
-      const trace = {{
+      };
+      const trace = {
         type: "bar",
         orientation: "h",
         x: R.x,
         y: R.y,
-        marker: {{
+        marker: {
           color: R.c,
           colorscale: els.scale.value,
           showscale: true
-        }},
+        },
         hovertemplate:
-          TERM + ": %{{y}}<br>" +
-          els.x.value + ": %{{x}}<extra></extra>",
+          TERM + ": %{y}<br>" +
+          els.x.value + ": %{x}<extra></extra>",
         text: R.y,
         textposition: "auto"
-      }};
-      const config = {{
+      };
+      const config = {
         responsive: true,
         displaylogo: false,
         modeBarButtonsToRemove: ["autoScale2d", "toggleSpikelines"]
-      }};
-      Plotly.newPlot(els.plot, [trace], layout, config);
-    }};
-
-    ["input","change"].forEach(ev => {{
-      [els.search, els.x, els.color, els.scale, els.sortby, els.order, els.top, els.ypos]
+      };
+      // first render builds the plot, later ones only diff trace/layout
+      if (!initialized) {
+        Plotly.newPlot(els.plot, [trace], layout, config);
+        initialized = true;
+      } else {
+        Plotly.react(els.plot, [trace], layout, config);
+      }
+    };
+
+    els.search.addEventListener("input", debounce(render, 120));
+    ["input","change"].forEach(ev => {
+      [els.x, els.color, els.scale, els.sortby, els.order, els.top, els.ypos]
         .forEach(el => el.addEventListener(ev, render));
-    }});
+    });
 
 
-    render();
-    window.addEventListener("resize", () => Plotly.Plots.resize(els.plot));
-  }})();
+    // Initial render, deferred until the chart card is on screen
+    whenVisible(els.plot.parentElement, () => { if (!initialized) render(); });
+    onResizeFrame(() => { if (initialized) Plotly.Plots.resize(els.plot); });
+  })();
   </script>
   </body>
   </html>
-  """
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html)
+  """)
+
+# Lightweight Vega-Lite variant of the bar chart page, split around the embedded spec
+# (pinned vega 5.30.0, vega-lite 5.21.0 and vega-embed 6.26.0)
+VEGALITE_BAR_CHART_HEAD = Template("""<!DOCTYPE html>
+  <html lang="en">
+  <head>
+  <meta charset="utf-8"/>
+  <meta name="viewport" content="width=device-width,initial-scale=1"/>
+  <title>$title_html</title>
+  <script src="https://cdn.jsdelivr.net/npm/vega@5.30.0"></script>
+  <script src="https://cdn.jsdelivr.net/npm/vega-lite@5.21.0"></script>
+  <script src="https://cdn.jsdelivr.net/npm/vega-embed@6.26.0"></script>
+  <style>
+$base_css
+  .vega-bindings{display:flex; flex-wrap:wrap; gap:12px; margin-bottom:10px; font-size:12px; color:var(--muted)}
+  .vega-bind input{accent-color:var(--accent)}
+  </style>
+  </head>
+  <body>
+    <div class="header">
+      <h1>$title_html</h1>
+    </div>
+
+    <div class="card">
+      <div class="header-bar"><div class="title">Chart</div></div>
+      <div class="body plot-wrap">
+        <div id="bar_$uid" style="width:100%"></div>
+      </div>
+    </div>
+
+  <script>
+  (function(){
+    const SPEC = """)
+VEGALITE_BAR_CHART_TAIL = Template(""";
+    vegaEmbed("#bar_$uid", SPEC, {
+      renderer: "canvas",
+      actions: {export: true, source: false, compiled: false, editor: false}
+    });
+  })();
+  </script>
+  </body>
+  </html>
+  """)
+
+# Result tables with at least this many rows get the Vega-Lite bar chart
+# (see generate_interactive_bar_chart_html_async)
+VEGALITE_BAR_CHART_MIN_ROWS = 5000
+
+# Single background thread that writes chart pages off the UI thread
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart-html")
+
+# --- Public Functions ---
+
+
+def generate_interactive_bubble_chart_html(
+    df: pd.DataFrame, output_file: str = "interactive_bubble_chart.html",
+    title: str = "Overrepresentation Analysis Bubble Chart", term_col: str = "Term"
+) -> None:
+    """
+    Enhanced interactive bubble chart with:
+      - Card UI
+      - Search + Top-N + sort controls
+      - Adjustable bubble min/max size
+      - Color scheme pickers (Viridis/Turbo/Cividis/Plasma/Magma)
+      - Export PNG/CSV buttons
+      - Responsive height based on Top N
+
+    The page loads the pinned plotly.js 2.35.2 "gl2d" partial bundle, which contains the
+    scattergl trace used here and is much smaller than the full build.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing enrichment results.
+        output_file (str): Path to save the generated HTML file.
+        title (str): Title of the plot.
+        term_col (str): Name of the column containing term names.
+
+    Returns:
+        None
+    """
+
+    if term_col not in df.columns:
+        raise ValueError(f"term_col '{term_col}' not found in DataFrame")
+
+    # Default set
+    candidates = [
+        "Overlap Count", "Total Genes", "Overlap Ratio", "-log10 P-value",
+        "-log10 Adjusted P-value", "Odds Ratio", "Combined Score", "Gene Count"
+    ]
+    # Filter columns
+    present_cols, numeric_cols = _filter_valid_columns(df, candidates)
+
+    if not present_cols:
+        # fallback: use all numeric columns + term
+        numeric_cols = [c for c in df.columns if c !=
+                        term_col and pd.api.types.is_numeric_dtype(df[c])]
+        present_cols = numeric_cols[:]
+
+    # Ensure JSON-safe; only the term and selectable columns are sent to the page
+    json_data = _columns_to_json(df, [term_col, *present_cols])
+
+    # The page is written around the column data so the (large) JSON payload is written on its own
+    values = _template_values(title, term_col, present_cols, numeric_cols)
+    _write_html(output_file, BUBBLE_CHART_HEAD.substitute(values),
+                json_data, BUBBLE_CHART_TAIL.substitute(values))
+    print(f"Interactive bubble chart saved to {output_file}")
+
+
+def generate_interactive_bar_chart_html(
+    df: pd.DataFrame, output_file: str = "interactive_bubble_chart.html",
+    title: str = "Overrepresentation Analysis Bar Chart", term_col: str = "Term"
+) -> None:
+    """
+    Enhanced interactive bar chart with:
+      - Card UI
+      - Search + Top-N + sort controls
+      - Color scheme pickers (Viridis/Turbo/Cividis/Plasma/Magma)
+      - Export PNG/CSV buttons
+      - Responsive height based on Top N
+
+    The page loads the pinned plotly.js 2.35.2 "basic" partial bundle (scatter, bar, pie),
+    which covers the bar trace and is much smaller than the full build.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing enrichment results.
+        output_file (str): Path to save the generated HTML file.
+        title (str): Title of the plot.
+        term_col (str): Name of the column containing term names.
+
+    Returns:
+        None
+    """
+
+    if term_col not in df.columns:
+        raise ValueError(f"term_col '{term_col}' not found in DataFrame")
+
+    candidates = [
+        "Overlap Count", "Total Genes", "Overlap Ratio", "-log10 P-value",
+        "-log10 Adjusted P-value", "Odds Ratio", "Combined Score", "Gene Count"
+    ]
+    present_cols, numeric_cols = _filter_valid_columns(df, candidates)
+    if not present_cols:
+        numeric_cols = [c for c in df.columns if c !=
+                        term_col and pd.api.types.is_numeric_dtype(df[c])]
+        present_cols = numeric_cols[:]
+
+    json_data = _columns_to_json(df, [term_col, *present_cols])
+
+    values = _template_values(title, term_col, present_cols, numeric_cols)
+    _write_html(output_file, BAR_CHART_HEAD.substitute(values),
+                json_data, BAR_CHART_TAIL.substitute(values))
+    print(f"Interactive bar chart saved to {output_file}")
+
+
+def generate_interactive_bar_chart_vegalite(
+    df: pd.DataFrame, output_file: str = "interactive_bar_chart.html",
+    title: str = "Overrepresentation Analysis Bar Chart", term_col: str = "Term"
+) -> None:
+    """
+    Lightweight alternative to generate_interactive_bar_chart_html rendered with Vega-Lite.
+
+    The full chart spec is built here and embedded in the page, which only loads the
+    Vega/Vega-Lite runtime (a fraction of the Plotly bundle). Controls are limited to
+    a term search and a Top-N slider; X-axis, color and ranking use the same default
+    columns as the Plotly chart. Intended for very large result tables; the bar chart
+    widget gets it from VEGALITE_BAR_CHART_MIN_ROWS rows (see
+    generate_interactive_bar_chart_html_async).
+
+    Args:
+        df (pd.DataFrame): DataFrame containing enrichment results.
+        output_file (str): Path to save the generated HTML file.
+        title (str): Title of the plot.
+        term_col (str): Name of the column containing term names.
+
+    Returns:
+        None
+    """
+    if term_col not in df.columns:
+        raise ValueError(f"term_col '{term_col}' not found in DataFrame")
+
+    candidates = [
+        "Overlap Count", "Total Genes", "Overlap Ratio", "-log10 P-value",
+        "-log10 Adjusted P-value", "Odds Ratio", "Combined Score", "Gene Count"
+    ]
+    _, numeric_cols = _filter_valid_columns(df, candidates)
+    if not numeric_cols:
+        numeric_cols = [c for c in df.columns if c !=
+                        term_col and pd.api.types.is_numeric_dtype(df[c])]
+    if not numeric_cols:
+        raise ValueError("No numeric columns available for the bar chart")
+
+    def _pick(preferred: str, fallback: str) -> str:
+        return preferred if preferred in numeric_cols else fallback
+
+    x_col = _pick("Overlap Ratio", numeric_cols[0])
+    color_col = _pick("-log10 P-value", x_col)
+    rank_col = _pick("-log10 Adjusted P-value", x_col)
+
+    columns = list(dict.fromkeys([term_col, x_col, color_col, rank_col]))
+    values = [dict(zip(columns, row))
+              for row in df[columns].itertuples(index=False, name=None)]
+    term_js = json.dumps(term_col)
+
+    spec = {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": title,
+        "width": "container",
+        "height": {"step": 22},
+        "background": "transparent",
+        "data": {"values": values},
+        "params": [
+            {"name": "search", "value": "",
+             "bind": {"input": "search", "placeholder": "type to filter...",
+                      "name": f"Search {term_col} "}},
+            {"name": "top_n", "value": min(20, max(len(values), 1)),
+             "bind": {"input": "range", "min": 1, "max": max(len(values), 1), "step": 1,
+                      "name": "Top-N "}},
+        ],
+        "transform": [
+            {"filter": f"!search || indexof(lower(datum[{term_js}] + ''), lower(search)) >= 0"},
+            {"window": [{"op": "row_number", "as": "_rank"}],
+             "sort": [{"field": _vegalite_field(rank_col), "order": "descending"}]},
+            {"filter": "datum._rank <= top_n"},
+        ],
+        "mark": {"type": "bar", "tooltip": True},
+        "encoding": {
+            "y": {"field": _vegalite_field(term_col), "type": "nominal", "sort": "-x",
+                  "title": term_col},
+            "x": {"field": _vegalite_field(x_col), "type": "quantitative", "title": x_col},
+            "color": {"field": _vegalite_field(color_col), "type": "quantitative",
+                      "title": color_col, "scale": {"scheme": "viridis"}},
+        },
+    }
+
+    page_values = _template_values(title, term_col, [], [])
+    _write_html(output_file, VEGALITE_BAR_CHART_HEAD.substitute(page_values),
+                _script_json(spec, orjson.OPT_SERIALIZE_NUMPY),
+                VEGALITE_BAR_CHART_TAIL.substitute(page_values))
     print(f"Interactive bar chart saved to {output_file}")
 
+
+def generate_interactive_bubble_chart_html_async(
+    df: pd.DataFrame, output_file: str = "interactive_bubble_chart.html",
+    title: str = "Overrepresentation Analysis Bubble Chart", term_col: str = "Term"
+) -> Future:
+    """
+    Run generate_interactive_bubble_chart_html on a background thread.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing enrichment results (must not be modified meanwhile).
+        output_file (str): Path to save the generated HTML file.
+        title (str): Title of the plot.
+        term_col (str): Name of the column containing term names.
+
+    Returns:
+        Future: Completes once the file is written; re-raises any generator error.
+    """
+    return _EXECUTOR.submit(
+        generate_interactive_bubble_chart_html, df, output_file, title, term_col)
+
+
+def generate_interactive_bar_chart_html_async(
+    df: pd.DataFrame, output_file: str = "interactive_bubble_chart.html",
+    title: str = "Overrepresentation Analysis Bar Chart", term_col: str = "Term",
+    lightweight: bool | None = None
+) -> Future:
+    """
+    Run generate_interactive_bar_chart_html, or its lightweight Vega-Lite variant
+    generate_interactive_bar_chart_vegalite, on a background thread.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing enrichment results (must not be modified meanwhile).
+        output_file (str): Path to save the generated HTML file.
+        title (str): Title of the plot.
+        term_col (str): Name of the column containing term names.
+        lightweight (bool | None): Use the Vega-Lite chart. None (default) uses it for
+            tables with at least VEGALITE_BAR_CHART_MIN_ROWS rows.
+
+    Returns:
+        Future: Completes once the file is written; re-raises any generator error.
+    """
+    if lightweight is None:
+        lightweight = len(df) >= VEGALITE_BAR_CHART_MIN_ROWS
+    generate = (generate_interactive_bar_chart_vegalite if lightweight
+                else generate_interactive_bar_chart_html)
+    return _EXECUTOR.submit(generate, df, output_file, title, term_col)
+
 # --- Private Functions ---
 
 
@@ -687,8 +907,124 @@ def _filter_valid_columns(df: pd.DataFrame, candidates: list[str]) -> tuple[list
             - The first list contains the valid column names present in the DataFrame.
             - The second list contains the numeric column names.
     """
-    cols = [c for c in candidates if c in df.columns]
-
-    # Keep numeric-only where needed
-    numeric_cols = [c for c in cols if pd.api.types.is_numeric_dtype(df[c])]
+    dtypes = df.dtypes
+    cols: list[str] = []
+    numeric_cols: list[str] = []
+    for c in candidates:
+        dtype = dtypes.get(c)
+        if dtype is None:
+            continue
+        cols.append(c)
+        # Keep numeric-only where needed
+        if pd.api.types.is_numeric_dtype(dtype):
+            numeric_cols.append(c)
     return cols, numeric_cols
+
+
+def _template_values(
+    title: str, term_col: str, present_cols: list[str], numeric_cols: list[str]
+) -> dict[str, str]:
+    """Build the placeholder values shared by the chart page templates.
+
+    Args:
+        title (str): Title of the plot.
+        term_col (str): Name of the column containing term names.
+        present_cols (list[str]): Columns offered in the color/sort selectors.
+        numeric_cols (list[str]): Numeric columns offered for the axes.
+
+    Returns:
+        dict[str, str]: Mapping of template placeholder names to their values.
+    """
+    return {
+        "uid": uuid.uuid4().hex,  # unique ID for HTML element IDs
+        "title_html": escape(title),
+        "title_json": json.dumps(title),
+        "term_col_html": escape(term_col),
+        "term_col_json": json.dumps(term_col),
+        "valid_columns_json": json.dumps(present_cols),
+        "numeric_columns_json": json.dumps(numeric_cols),
+        "base_css": CHART_BASE_CSS,
+        "helpers_js": CHART_HELPERS_JS,
+    }
+
+
+def _write_html(output_file: str, *parts: str) -> None:
+    """Write the HTML document piece by piece instead of joining it in memory first.
+    Paths ending in ".gz" (e.g. "chart.html.gz") are written gzip-compressed.
+
+    Args:
+        output_file (str): Path to save the HTML file.
+        *parts (str): Consecutive pieces of the document.
+    """
+    if str(output_file).endswith(".gz"):
+        f = gzip.open(output_file, "wt", encoding="utf-8", compresslevel=6)
+    else:
+        f = open(output_file, "w", encoding="utf-8", buffering=1 << 16)
+    with f:
+        for part in parts:
+            f.write(part)
+
+
+def _columns_to_json(df: pd.DataFrame, columns: list[str]) -> str:
+    """Serialize the given DataFrame columns to a JSON object of column name -> value array,
+    with missing values as null.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to serialize.
+        columns (list[str]): Columns to include (duplicates are ignored).
+
+    Returns:
+        str: JSON object with one array per column.
+    """
+    data = {col: df[col].tolist() for col in dict.fromkeys(columns)}
+    return _script_json(data, orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def _script_json(obj, option: int) -> str:
+    """Serialize an object with orjson for embedding in an inline <script> block.
+
+    orjson does not escape "/", so a "</script>" inside a value (e.g. a term
+    name) would end the script element; "</" is written as "<\\/" instead,
+    which JSON and JavaScript read back as the same string.
+
+    Args:
+        obj: The object to serialize.
+        option (int): orjson option flags.
+
+    Returns:
+        str: JSON text safe to place inside a <script> element.
+    """
+    return orjson.dumps(obj, default=_json_default, option=option).replace(
+        b"</", b"<\\/").decode("utf-8")
+
+
+def _vegalite_field(name: str) -> str:
+    """Escape a column name for use as a Vega-Lite field reference.
+
+    Dots and brackets would otherwise be read as nested-field access.
+
+    Args:
+        name (str): Column name.
+
+    Returns:
+        str: Escaped field name.
+    """
+    for ch in ("\\", ".", "[", "]"):
+        name = name.replace(ch, "\\" + ch)
+    return name
+
+
+def _json_default(value):
+    """Map values orjson cannot serialize natively (pd.NA, pd.NaT, ...) to JSON.
+
+    NaN floats are already written as null by orjson itself.
+
+    Args:
+        value: The value orjson could not serialize.
+
+    Returns:
+        None for missing values, otherwise the value's string form.
+    """
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return str(value)
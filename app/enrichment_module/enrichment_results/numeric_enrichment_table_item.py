@@ -8,12 +8,22 @@ from PyQt5.QtWidgets import QTableWidgetItem
 class NumericEnrichmentTableWidgetItem(QTableWidgetItem):
     """Custom QTableWidgetItem to force numerical sorting."""
 
+    __slots__ = ("value",)  # no per-item __dict__ for the single stored value
+
     def __init__(self, value, display_text):
         super().__init__(display_text)  # Display the text
-        self.value = value  # Store the actual numeric value
+        self.value = float(value)  # Store the actual numeric value (cast once for sorting)
 
     def __lt__(self, other):
         """Ensure numerical sorting for numeric values."""
-        if isinstance(other, NumericEnrichmentTableWidgetItem):
+        try:
             return self.value < other.value
-        return super().__lt__(other)  # Default behavior
+        except AttributeError:
+            return super().__lt__(other)  # Default behavior
+
+    def __gt__(self, other):
+        """Mirror of __lt__ for reflected comparisons."""
+        try:
+            return self.value > other.value
+        except AttributeError:
+            return other.__lt__(self)
@@ -1,22 +1,29 @@
 """Utility functions for the enrichment module"""
 
+# --- Standard Library Imports ---
+from functools import lru_cache
+
 # --- Third Party Imports ---
-import json
+import orjson
 
 # --- Local Imports ---
 from app.utils import resource_path
 
 
 # --- Public Functions ----
+@lru_cache(maxsize=1)
 def load_tax2name() -> dict[str, str]:
     """Loads the Tax ID to organism name mapping from a JSON file.
 
+    The file is only read on the first call; later calls return the same
+    dictionary, so callers must not modify it.
+
     Returns:
         A dictionary mapping Tax IDs (as strings) to organism names.
     """
     # Load JSON file
     with open(resource_path("assets/external_data/gene2organism_mapping/tax2name.json"),
-              "r", encoding="utf-8") as file:
-        data = json.load(file)  # Load JSON into a dictionary
+              "rb") as file:
+        data = orjson.loads(file.read())  # Load JSON into a dictionary
 
     return data
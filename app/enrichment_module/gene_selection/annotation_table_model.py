@@ -0,0 +1,74 @@
+"""Provides a Qt table model for the annotation list on the gene detail page"""
+
+# --- Third Party Imports ---
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# --- Constants ---
+ANNOTATION_COLUMNS = ["text", "accession", "pubmed_id",
+                      "section_number", "offset_start", "length", "tax_id"]
+ANNOTATION_HEADERS = [c.replace("_", " ").title() for c in ANNOTATION_COLUMNS]
+# columns shown right-aligned
+NUMERIC_COLUMNS = frozenset(
+    ANNOTATION_COLUMNS.index(c) for c in ("section_number", "offset_start", "length"))
+SECTION_NUMBER_COLUMN = ANNOTATION_COLUMNS.index("section_number")
+
+
+# --- Public Classes ---
+class AnnotationTableModel(QAbstractTableModel):
+    """Read-only table model over a gene's annotation dicts.
+
+    The annotation list is wrapped as is; cell text is only built when the
+    view asks for a visible cell, so opening a gene with many annotations
+    does not create one table item per cell.
+    """
+
+    def __init__(self, ann_list: list[dict] | None = None, parent=None):
+        """Read-only table model over a gene's annotation dicts.
+
+        Args:
+            ann_list (list[dict] | None, optional): Annotation dicts. Defaults to None.
+            parent (QObject, optional): Parent QObject. Defaults to None.
+        """
+        super().__init__(parent)
+        self._rows: list[dict] = ann_list or []
+
+    # --- Public Methods ---
+    def set_annotations(self, ann_list: list[dict] | None) -> None:
+        """Replace the annotation list.
+
+        Args:
+            ann_list (list[dict] | None): New annotation dicts.
+        """
+        self.beginResetModel()
+        self._rows = ann_list or []
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of annotations."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(ANNOTATION_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        """Return the cell text and the alignment of numeric columns."""
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.DisplayRole:
+            item = self._rows[index.row()]
+            val = item.get(ANNOTATION_COLUMNS[col])
+            if val is None and col == SECTION_NUMBER_COLUMN:
+                val = item.get("passage_number")
+            return "" if val is None else str(val)
+        if role == Qt.TextAlignmentRole and col in NUMERIC_COLUMNS:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.DisplayRole) -> object:
+        """Return the column labels."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return ANNOTATION_HEADERS[section]
+        return None
@@ -0,0 +1,177 @@
+"""Provides a custom delegate for painting the per-document section cards of a gene"""
+
+# --- Third Party Imports ---
+from PyQt5.QtCore import QModelIndex, QRect, QSize, Qt
+from PyQt5.QtGui import QFont, QFontMetrics, QPainter
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QStyleOptionViewItem
+
+# --- Local Imports ---
+from app.enrichment_module.gene_selection.doc_card_model import DOC_CARD_ROLE
+
+# --- Constants ---
+CARD_MARGIN = 12  # padding inside a card
+CARD_SPACING = 12  # space between the header and each section
+SECTION_PADDING = 8  # padding around a section
+SECTION_SPACING = 6  # space between a section's meta line, text and divider
+CARD_RADIUS = 8
+# wrapped section text heights kept by the delegate before its cache is emptied
+TEXT_HEIGHT_CACHE_SIZE = 4096
+WRAP_FLAGS = int(Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap)
+
+
+# --- Public Classes ---
+class DocCardDelegate(QStyledItemDelegate):
+    """Delegate painting one document card (header and its sections) per row.
+
+    Replaces a widget tree per card: the view only asks for the size and the
+    painting of the cards in its viewport. Wrapped section text heights are
+    cached per passage and width, since they are needed for every size hint.
+    """
+
+    def __init__(self, view: QListView):
+        """Delegate painting one document card per row.
+
+        Args:
+            view (QListView): The list view showing the cards (its viewport
+                width is the card width).
+        """
+        super().__init__(view)
+        self._view = view
+        # bold font and font metrics of the last seen option font (see _fonts)
+        self._font_key: str | None = None
+        self._bold_font: QFont | None = None
+        self._fm: QFontMetrics | None = None
+        self._fm_b: QFontMetrics | None = None
+        # (pubmed id, section number, width) -> wrapped section text height
+        self._text_heights: dict[tuple, int] = {}
+
+    def paint(self, p: QPainter, opt: QStyleOptionViewItem, idx: QModelIndex) -> None:
+        """Paint a document card: PMID header, then each section with its text.
+
+        Args:
+            p (QPainter): Painter object.
+            opt (QStyleOptionViewItem): Style options for the item.
+            idx (QModelIndex): Model index of the item.
+        """
+        doc, sections = idx.model().data(idx, DOC_CARD_ROLE)
+        bold, fm, fm_b = self._fonts(opt.font)
+        text_color = opt.palette.text().color()
+        muted_color = opt.palette.mid().color()
+
+        p.save()
+        r = opt.rect.adjusted(0, 0, -1, -1)
+        p.setPen(muted_color)
+        p.setBrush(opt.palette.base())
+        p.drawRoundedRect(r, CARD_RADIUS, CARD_RADIUS)
+
+        x = r.left() + CARD_MARGIN
+        y = r.top() + CARD_MARGIN
+        w = r.width() - 2 * CARD_MARGIN
+        line_h = max(fm.height(), fm_b.height())
+
+        # Header: bold PMID, title (elided), muted mention count
+        head = f"PMID {doc['pubmed_id']}"
+        mentions = f" • {doc['total_mentions']} mentions"
+        p.setFont(bold)
+        p.setPen(text_color)
+        p.drawText(QRect(x, y, w, line_h), Qt.AlignLeft | Qt.AlignVCenter, head)
+        hx = x + fm_b.horizontalAdvance(head)
+        title = fm.elidedText(f" — {doc['title'] or '(no title)'}", Qt.ElideRight,
+                              max(0, x + w - hx - fm.horizontalAdvance(mentions)))
+        p.setFont(opt.font)
+        p.drawText(QRect(hx, y, x + w - hx, line_h),
+                   Qt.AlignLeft | Qt.AlignVCenter, title)
+        hx += fm.horizontalAdvance(title)
+        p.setPen(muted_color)
+        p.drawText(QRect(hx, y, max(0, x + w - hx), line_h),
+                   Qt.AlignLeft | Qt.AlignVCenter, mentions)
+        y += line_h
+
+        # Sections: meta line with bold count, wrapped text, divider
+        sx = x + SECTION_PADDING
+        sw = w - 2 * SECTION_PADDING
+        for sec in sections:
+            y += CARD_SPACING + SECTION_PADDING
+            meta = f"s{sec['section_number']} ({sec['section_type'] or sec['type']}): "
+            p.setFont(opt.font)
+            p.setPen(text_color)
+            p.drawText(QRect(sx, y, sw, line_h), Qt.AlignLeft | Qt.AlignVCenter, meta)
+            mx = sx + fm.horizontalAdvance(meta)
+            p.setFont(bold)
+            p.drawText(QRect(mx, y, max(0, sx + sw - mx), line_h),
+                       Qt.AlignLeft | Qt.AlignVCenter, f"{sec['count']}x")
+            y += line_h + SECTION_SPACING
+
+            text_h = self._text_height(doc, sec, sw, fm)
+            p.setFont(opt.font)
+            p.drawText(QRect(sx, y, sw, text_h), WRAP_FLAGS, sec["section_text"])
+            y += text_h + SECTION_SPACING
+
+            p.setPen(muted_color)
+            p.drawLine(sx, y, sx + sw, y)
+            y += 1 + SECTION_PADDING
+        p.restore()
+
+    def sizeHint(self, opt: QStyleOptionViewItem, idx: QModelIndex) -> QSize:
+        """Provide the card size: the viewport width and the height of its content.
+
+        Args:
+            opt (QStyleOptionViewItem): Style options for the item.
+            idx (QModelIndex): Model index of the item.
+        Returns:
+            QSize: Size hint for the item.
+        """
+        doc, sections = idx.model().data(idx, DOC_CARD_ROLE)
+        _, fm, fm_b = self._fonts(opt.font)
+        width = max(1, self._view.viewport().width() - 2 * self._view.spacing())
+        sw = max(1, width - 1 - 2 * CARD_MARGIN - 2 * SECTION_PADDING)
+        line_h = max(fm.height(), fm_b.height())
+        height = 2 * CARD_MARGIN + line_h + 1
+        for sec in sections:
+            height += (CARD_SPACING + 2 * SECTION_PADDING + line_h + 2 * SECTION_SPACING
+                       + self._text_height(doc, sec, sw, fm) + 1)
+        return QSize(width, height)
+
+    # --- Private Methods ---
+    def _fonts(self, f: QFont) -> tuple[QFont, QFontMetrics, QFontMetrics]:
+        """Return the bold font and the metrics of the font and its bold version.
+
+        They are built once and reused until the option font changes.
+
+        Args:
+            f (QFont): Font of the style option.
+        Returns:
+            tuple[QFont, QFontMetrics, QFontMetrics]: Bold font, metrics of the
+                font, metrics of the bold font.
+        """
+        key = f.key()
+        if key != self._font_key:
+            bold = QFont(f)
+            bold.setBold(True)
+            self._font_key = key
+            self._bold_font = bold
+            self._fm = QFontMetrics(f)
+            self._fm_b = QFontMetrics(bold)
+            self._text_heights.clear()
+        return self._bold_font, self._fm, self._fm_b
+
+    def _text_height(self, doc: dict, sec: dict, width: int, fm: QFontMetrics) -> int:
+        """Return the height of a section's text wrapped to a width.
+
+        Args:
+            doc (dict): Document of the section.
+            sec (dict): Section (its text is the passage of the document).
+            width (int): Wrap width in pixels.
+            fm (QFontMetrics): Metrics of the text font.
+        Returns:
+            int: Wrapped text height in pixels.
+        """
+        key = (doc["pubmed_id"], sec["section_number"], width)
+        height = self._text_heights.get(key)
+        if height is None:
+            if len(self._text_heights) >= TEXT_HEIGHT_CACHE_SIZE:
+                self._text_heights.clear()
+            height = fm.boundingRect(
+                QRect(0, 0, width, 0), WRAP_FLAGS, sec["section_text"]).height()
+            self._text_heights[key] = height
+        return height
@@ -0,0 +1,74 @@
+"""Provides a Qt model for the per-document section cards of a gene"""
+
+# --- Third Party Imports ---
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+# --- Constants ---
+# role serving (doc, visible sections) of a card to DocCardDelegate
+DOC_CARD_ROLE = Qt.UserRole + 1
+
+
+# --- Public Classes ---
+class DocCardModel(QAbstractListModel):
+    """List model with one row per document card of a gene's sections page.
+
+    Rows are the documents of the grouped sections (see
+    SelectedGeneCardsWidget._fetch_sections_grouped_for_gene) that pass the
+    current filter, each with the sections that match it. Filtering rebuilds
+    this row list; no widgets are created per card or section.
+    """
+
+    def __init__(self, parent=None):
+        """List model with one row per document card.
+
+        Args:
+            parent (QObject, optional): Parent QObject. Defaults to None.
+        """
+        super().__init__(parent)
+        self._docs: list[dict] = []
+        self._rows: list[tuple[dict, list[dict]]] = []  # (doc, visible sections)
+
+    # --- Public Methods ---
+    def set_docs(self, docs: list[dict]) -> None:
+        """Replace the documents and show all of them.
+
+        Args:
+            docs (list[dict]): Documents of the grouped sections, in display order.
+        """
+        self.beginResetModel()
+        self._docs = docs or []
+        self._rows = [(doc, doc["sections"]) for doc in self._docs]
+        self.endResetModel()
+
+    def set_filter(self, query: str, pmid_filter: str) -> None:
+        """Show only the sections containing the query, in documents matching the PMID filter.
+
+        Args:
+            query (str): Lowercase text searched in each section's "_haystack".
+            pmid_filter (str): Text the document PMID must contain (empty for all).
+        """
+        rows = []
+        for doc in self._docs:
+            if pmid_filter and pmid_filter not in doc["pubmed_id"]:
+                continue
+            sections = doc["sections"] if not query else [
+                p for p in doc["sections"] if query in p["_haystack"]]
+            if sections:
+                rows.append((doc, sections))
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of visible document cards."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        """Return the card content (DOC_CARD_ROLE) or the PMID label of a row."""
+        if not index.isValid():
+            return None
+        if role == DOC_CARD_ROLE:
+            return self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"PMID {self._rows[index.row()][0]['pubmed_id']}"
+        return None
@@ -1,6 +1,7 @@
 """Provides a dialog for exporting (selected) genes in various formats"""
 
 # --- Third Party Imports ---
+import orjson
 from PyQt5.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -67,6 +68,18 @@ class ExportDialog(QDialog):
         if path:  # Only update if a valid path is selected
             self.export_path = path  # This will use the setter method
 
+    @staticmethod
+    def dump_json(obj, path: str) -> None:
+        """Write the export data as indented JSON (serialized with orjson).
+
+        Args:
+            obj: JSON-serializable export data (numpy values are supported).
+            path (str): Target file path.
+        """
+        with open(path, "wb") as file:
+            file.write(orjson.dumps(
+                obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+
     @property
     def export_all(self):
         """Whether to export all genes or only selected ones."""
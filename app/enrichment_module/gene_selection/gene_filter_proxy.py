@@ -0,0 +1,76 @@
+"""Provides a filter proxy model for the gene list table in the gene selection tab"""
+
+# --- Third Party Imports ---
+import numpy as np
+from PyQt5.QtCore import QModelIndex, QSortFilterProxyModel, Qt
+
+
+# --- Public Classes ---
+class GeneFilterProxy(QSortFilterProxyModel):
+    """Filter proxy for the GeneTableModel.
+
+    Row acceptance is read from a boolean mask over the source rows that is
+    computed in one vectorized pass (see GeneTableModel.contains_mask), so the
+    proxy never evaluates the filter text per row. Sorting is delegated to the
+    source model, which reorders its columns (and the mask) with numpy.
+    """
+
+    def __init__(self, parent=None):
+        """Filter proxy for the GeneTableModel.
+
+        Args:
+            parent (QObject, optional): Parent QObject. Defaults to None.
+        """
+        super().__init__(parent)
+        self._accept: np.ndarray | None = None  # None accepts every row
+
+    # --- Public Methods ---
+    def setSourceModel(self, model) -> None:
+        """Set the source gene table model; the mask is dropped when it is reset."""
+        old = self.sourceModel()
+        if old is not None:
+            old.modelAboutToBeReset.disconnect(self._drop_mask)
+        self._accept = None
+        super().setSourceModel(model)
+        if model is not None:
+            model.modelAboutToBeReset.connect(self._drop_mask)
+
+    def set_accept_mask(self, mask: np.ndarray | None) -> None:
+        """Set which source rows are shown and refilter once.
+
+        Args:
+            mask (np.ndarray | None): Boolean mask over the source rows, or None
+                to show all rows.
+        """
+        self._accept = mask
+        self.invalidateFilter()
+
+    def accept_mask(self) -> np.ndarray | None:
+        """Return the current mask over the source rows (None if all rows are shown)."""
+        return self._accept
+
+    def accepted_rows(self) -> list[int]:
+        """Return the source rows that pass the filter, in source order."""
+        if self._accept is None:
+            return list(range(self.sourceModel().rowCount()))
+        return np.flatnonzero(self._accept).tolist()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Return whether a source row passes the current mask."""
+        mask = self._accept
+        return mask is None or source_row >= len(mask) or bool(mask[source_row])
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """Sort the source model by a column and keep the mask aligned with its rows."""
+        model = self.sourceModel()
+        new_order = model.sort_order(column, order)
+        if new_order is None:
+            return
+        if self._accept is not None:
+            self._accept = self._accept[new_order]
+        model.apply_row_order(new_order)
+
+    # --- Private Methods ---
+    def _drop_mask(self) -> None:
+        """Show all rows again (the mask no longer matches the source rows)."""
+        self._accept = None
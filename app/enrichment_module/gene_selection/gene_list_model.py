@@ -1,13 +1,38 @@
 """Provides a Qt model for displaying and managing a list of genes in the enrichment module"""
 
+# --- Standard Library Imports ---
+import sys
+from operator import itemgetter
+from typing import NamedTuple
+
 # --- Third Party Imports ---
-from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, QVariant
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
 
 # --- Local Imports ---
 from app.enrichment_module.gene_selection.gene_roles import GeneRoles
 
 
+# --- Constants ---
+# gene fields joined (in this order) into the lowercase filter string
+SEARCH_FIELDS = ("gene_symbol", "entrez_id", "tax_id", "gfidf", "annotations")
+_get_search_fields = itemgetter(*SEARCH_FIELDS)
+# header mode -> precomputed column served as the card title (GeneRoles.TITLE)
+TITLE_COLUMNS = {"Symbol": "_symbols", "Entrez ID": "_entrez"}
+DEFAULT_TITLE_COLUMN = "_display"
+# tax ids longer than this are cut for the card's chips line
+MAX_CHIPS_LENGTH = 22
+
+
 # --- Public Classes ---
+class GeneCard(NamedTuple):
+    """Text of one gene card, served as a whole for GeneRoles.CARD."""
+    title: str
+    subtitle: str
+    chips: str
+
+
 class GeneListModel(QAbstractListModel):
     """Qt model for a list of genes."""
 
@@ -19,6 +44,7 @@ class GeneListModel(QAbstractListModel):
         """
         super().__init__(parent)
         self._genes: list[dict] = genes or []
+        self._title_column = DEFAULT_TITLE_COLUMN
         self._precompute()
 
     # --- Public Methods ---
@@ -26,47 +52,242 @@ class GeneListModel(QAbstractListModel):
         """Return the number of rows in the model."""
         return 0 if parent.isValid() else len(self._genes)
 
-    def data(self, index: QModelIndex, role: int) -> QVariant:
-        """Return data for a given index and role."""
-
-        if not index.isValid():
-            return QVariant()
-        g = self._genes[index.row()]
-        if role in (Qt.DisplayRole, Qt.EditRole):
-            return f"{g.get('gene_symbol', '')} • {g.get('entrez_id', '')}"
-        if role == GeneRoles.SYMBOL:
-            return g.get("gene_symbol", "")
-        if role == GeneRoles.ENTrez:
-            return g.get("entrez_id", "")
-        if role == GeneRoles.ANN:
-            return int(g.get("annotations", 0) or 0)
-        if role == GeneRoles.GFIDF:
-            return float(g.get("gfidf", 0.0) or 0.0)
-        if role == GeneRoles.TAX:
-            return str(g.get("tax_id", "") or "")
-        if role == GeneRoles.DATA:
-            return g
-        if role == GeneRoles.SEARCH:
-            return g.get("_search_str", "")
-        return QVariant()
+    def data(self, index: QModelIndex, role: int) -> object:
+        """Return data for a given index and role (None for unsupported roles)."""
+
+        column = self._roles_table.get(role)
+        if column is None or not index.isValid():
+            return None  # Qt treats None as an invalid QVariant
+        return column[index.row()]
 
     def update(self, genes: list[dict] | None) -> None:
         """Update the model with a new list of genes.
+
+        If the row count is unchanged, only the span of rows whose values differ
+        is reported via dataChanged; otherwise the model is reset.
+
         Args:
             genes (list[dict] | None): New list of gene dictionaries.
         """
+        genes = genes or []
+        if self._genes and len(genes) == len(self._genes):
+            old_rows = self._row_signatures()
+            self._genes = genes
+            self._precompute()
+            changed = [row for row, (old, new) in enumerate(
+                zip(old_rows, self._row_signatures())) if old != new]
+            if changed:
+                self.dataChanged.emit(
+                    self.index(changed[0]), self.index(changed[-1]), [])
+            return
+
         self.beginResetModel()
-        self._genes = genes or []
+        self._genes = genes
         self._precompute()
         self.endResetModel()
 
+    def set_header_mode(self, mode: str) -> None:
+        """Set which text the rows show as card title (GeneRoles.TITLE).
+
+        The title is one of the precomputed columns, so switching the mode only
+        swaps the column served for the role and reports the change once.
+
+        Args:
+            mode (str): "Symbol", "Entrez ID" or "Symbol + Entrez".
+        """
+        column = TITLE_COLUMNS.get(mode, DEFAULT_TITLE_COLUMN)
+        if column == self._title_column:
+            return
+        self._title_column = column
+        self._roles_table[GeneRoles.TITLE] = getattr(self, column)
+        self._roles_table[GeneRoles.CARD] = self._build_cards()
+        if self._genes:
+            self.dataChanged.emit(self.index(0), self.index(len(self._genes) - 1),
+                                  [GeneRoles.TITLE, GeneRoles.CARD])
+
+    def ann_array(self) -> np.ndarray:
+        """Return the annotation counts of all rows as an int32 array (do not modify).
+
+        Returns:
+            np.ndarray: Annotation count per source row.
+        """
+        return self._ann_np
+
+    def tax_count(self) -> int:
+        """Return the number of distinct (non-empty) tax ids of all rows."""
+        return len(set(self._tax).difference(("",)))
+
+    def sort_permutation(self, column: str, descending: bool = False) -> np.ndarray:
+        """Return the source rows in order of a precomputed column.
+
+        The permutation comes from a single stable numpy argsort and is cached
+        per column and order until the model data changes.
+
+        Args:
+            column (str): Name of the sort key column, e.g. "_ann_np" or "_symbols_lc".
+            descending (bool, optional): Sort in descending order. Defaults to False.
+        Returns:
+            np.ndarray: Source row indices (ties keep the source row order).
+        """
+        perm = self._perm_cache.get((column, descending))
+        if perm is None:
+            key = np.asarray(getattr(self, column))
+            if descending:
+                # stable descending: argsort the reversed keys, then undo the reversal
+                n = len(key)
+                perm = (n - 1 - np.argsort(key[::-1], kind="stable"))[::-1]
+            else:
+                perm = np.argsort(key, kind="stable")
+            self._perm_cache[(column, descending)] = perm
+        return perm
+
+    def matching_rows(self, query: str, deep: bool = False) -> set[int]:
+        """Return the rows whose search string contains the lowercase query.
+
+        Candidate rows are taken from a trigram index (intersection over the
+        query's trigrams) and then confirmed with a substring check; queries
+        shorter than a trigram fall back to a scan. The last result per corpus
+        is cached.
+
+        Args:
+            query (str): Lowercase search text.
+            deep (bool): Search the annotation corpus (deep search) instead of
+                the gene fields. Its index is built on first use.
+        Returns:
+            set[int]: Matching source rows.
+        """
+        last = self._last_match.get(deep)
+        if last is not None and last[0] == query:
+            return last[1]
+
+        if deep:
+            texts = self._deep_search
+            if self._deep_trigram_idx is None:
+                self._deep_trigram_idx = _build_trigram_index(texts)
+            index = self._deep_trigram_idx
+        else:
+            texts, index = self._search, self._trigram_idx
+
+        if len(query) < 3:
+            candidates = range(len(texts))
+        else:
+            candidates = None
+            for tri in {query[i:i + 3] for i in range(len(query) - 2)}:
+                rows = index.get(tri)
+                if not rows:
+                    candidates = ()
+                    break
+                candidates = rows if candidates is None else candidates & rows
+        rows = {row for row in candidates if query in texts[row]}
+        self._last_match[deep] = (query, rows)
+        return rows
+
     # --- Private Methods ---
+    def _build_cards(self) -> list[GeneCard]:
+        """Return the card text of every row for the current header mode."""
+        return list(map(GeneCard, getattr(self, self._title_column),
+                        self._subtitles, self._chips))
+
+    def _row_signatures(self) -> list[tuple]:
+        """Return the precomputed per-row values used to detect changed rows."""
+        return list(zip(self._display, self._ann, self._gfidf, self._tax,
+                        self._search, self._deep_search))
 
     def _precompute(self) -> None:
-        """Precompute search strings for each gene for efficient searching."""
-        for g in self._genes:
-            g["_search_str"] = " ".join(str(x) for x in [
-                g.get("gene_symbol", ""), g.get(
-                    "entrez_id", ""), g.get("tax_id", ""),
-                g.get("gfidf", ""), g.get("annotations", "")
-            ]).lower()
+        """Precompute per-role columns and search strings for efficient data() access.
+
+        Every role is stored as its own column (list) indexed by
+        row, so data() is a single lookup instead of dict access plus coercion.
+        """
+        genes = self._genes
+        n = len(genes)
+        # read every gene dict once (C-level itemgetter; .get only for genes with
+        # missing keys); raw values per SEARCH_FIELDS key, column-wise
+        records = []
+        for g in genes:
+            try:
+                records.append(_get_search_fields(g))
+            except KeyError:
+                records.append(tuple(g.get(key, "") for key in SEARCH_FIELDS))
+        raw = list(zip(*records)) or [()] * len(SEARCH_FIELDS)
+        raw_symbol, raw_entrez, raw_tax, raw_gfidf, raw_ann = raw
+
+        # identifiers repeat a lot (tax ids especially), so keep one interned copy each
+        intern = sys.intern
+        self._symbols: list[str] = [intern(str(v or "")) for v in raw_symbol]
+        self._entrez: list[str] = [intern(str(v or "")) for v in raw_entrez]
+        # numeric columns are filled straight into preallocated numpy arrays (used
+        # as sort keys); data() serves plain Python numbers from list copies
+        self._ann_np = np.fromiter((int(v or 0) for v in raw_ann),
+                                   dtype=np.int32, count=n)
+        self._gfidf_np = np.fromiter((float(v or 0.0) for v in raw_gfidf),
+                                     dtype=np.float64, count=n)
+        self._ann: list[int] = self._ann_np.tolist()
+        self._gfidf: list[float] = self._gfidf_np.tolist()
+        self._tax: list[str] = [intern(str(v or "")) for v in raw_tax]
+        # lowercase sort keys for the proxy's Symbol / Entrez ID sort modes
+        self._symbols_lc: list[str] = [intern(s.lower()) for s in self._symbols]
+        self._entrez_lc: list[str] = [intern(e.lower()) for e in self._entrez]
+        # display text built once; also used as the row title by NarrowGeneDelegate
+        self._display: list[str] = [
+            f"{s} • {e}" if (s and e) else (s or e or "(gene)")
+            for s, e in zip(self._symbols, self._entrez)]
+        # second and third line of the NarrowGeneDelegate card
+        self._subtitles: list[str] = [
+            f"{ann} ann  -  GF-IDF {gfidf:.3f}"
+            for ann, gfidf in zip(self._ann, self._gfidf)]
+        self._chips: list[str] = [
+            tax if len(tax) <= MAX_CHIPS_LENGTH else tax[:MAX_CHIPS_LENGTH - 2] + "…"
+            for tax in self._tax]
+
+        # one column-wise str/concat/lower pass instead of a join per gene
+        fields = [pd.Series(values, dtype=object).astype(str) for values in raw]
+        self._search: list[str] = fields[0].str.cat(
+            fields[1:], sep=" ").str.lower().tolist()
+
+        # annotation text / PMID / accession per gene for deep search; fields are
+        # newline-separated so a query (single line) cannot match across fields
+        self._deep_search: list[str] = [
+            "\n".join(
+                f"{a.get('text', '')}\n{a.get('pubmed_id', '')}\n{a.get('accession', '')}"
+                for a in (g.get("annotation_list") or [])).lower()
+            for g in genes]
+
+        self._trigram_idx = _build_trigram_index(self._search)
+        self._deep_trigram_idx: dict[str, set[int]] | None = None  # built lazily
+        self._last_match: dict[bool, tuple[str, set[int]]] = {}
+
+        self._perm_cache: dict[tuple[str, bool], np.ndarray] = {}
+        # role -> column; data() is a single dict lookup plus a list index
+        self._roles_table: dict[int, list] = {
+            Qt.DisplayRole: self._display,
+            Qt.EditRole: self._display,
+            GeneRoles.SYMBOL: self._symbols,
+            GeneRoles.ENTrez: self._entrez,
+            GeneRoles.ANN: self._ann,
+            GeneRoles.GFIDF: self._gfidf,
+            GeneRoles.TAX: self._tax,
+            GeneRoles.SEARCH: self._search,
+            GeneRoles.DEEP_SEARCH: self._deep_search,
+            GeneRoles.DATA: self._genes,
+            GeneRoles.TITLE: getattr(self, self._title_column),
+            GeneRoles.SUBTITLE: self._subtitles,
+            GeneRoles.CHIPS: self._chips,
+            GeneRoles.CARD: self._build_cards(),
+        }
+
+
+# --- Private Functions ---
+def _build_trigram_index(texts: list[str]) -> dict[str, set[int]]:
+    """Map every trigram occurring in the texts to the set of rows containing it.
+
+    Args:
+        texts (list[str]): One lowercase string per row.
+    Returns:
+        dict[str, set[int]]: Trigram -> rows.
+    """
+    index: dict[str, set[int]] = {}
+    for row, text in enumerate(texts):
+        for tri in {text[i:i + 3] for i in range(len(text) - 2)}:
+            index.setdefault(tri, set()).add(row)
+    return index
@@ -1,15 +1,33 @@
 """Provides a proxy model for filtering and sorting genes in the enrichment module"""
 
 # --- Third Party Imports ---
-from PyQt5.QtCore import QModelIndex, QSortFilterProxyModel, Qt
+import numpy as np
+from PyQt5.QtCore import QAbstractProxyModel, QModelIndex
 
 # --- Local Imports ---
 from app.enrichment_module.gene_selection.gene_roles import GeneRoles
 
+# --- Constants ---
+# sort mode prefix -> GeneListModel column holding the precomputed sort key
+# (argsorted once per column and order with numpy, see GeneListModel.sort_permutation)
+SORT_KEY_COLUMNS = {
+    "Annotations": "_ann_np",
+    "GF-IDF": "_gfidf_np",
+    "Symbol": "_symbols_lc",
+}
+DEFAULT_SORT_KEY_COLUMN = "_entrez_lc"
+# source roles that neither filtering nor sorting depend on
+DISPLAY_ONLY_ROLES = frozenset({GeneRoles.TITLE, GeneRoles.CARD})
+
 
 # --- Public Classes ---
-class GeneProxy(QSortFilterProxyModel):
-    """Proxy model for filtering and sorting genes."""
+class GeneProxy(QAbstractProxyModel):
+    """Proxy model for filtering and sorting genes.
+
+    The visible rows are kept as one array of source rows (filtered and in sort
+    order) that is rebuilt when the query, deep search flag, sort mode or source
+    data change, so Qt never calls back into Python per row to filter or sort.
+    """
 
     def __init__(self, parent=None):
         """Proxy model for filtering and sorting genes."""
@@ -17,65 +35,147 @@ class GeneProxy(QSortFilterProxyModel):
         # self._header_mode = "Symbol + Entrez"
         self._deep_search = False
         self._sort_mode = "Annotations (desc)"
-        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.setDynamicSortFilter(True)
+        self._key_arr_name = SORT_KEY_COLUMNS["Annotations"]
+        self._q = ""  # lowercase filter text (plain substring, not a regex)
+        self._rows = np.empty(0, dtype=np.intp)  # proxy row -> source row
+        self._proxy_rows: list[int] = []  # source row -> proxy row (-1 if hidden)
+        # accepted-row mask of the last (query, deep search) filter; reused while
+        # only the sort mode changes, dropped when the source data changes
+        self._accept_key: tuple[str, bool] | None = None
+        self._accept: np.ndarray | None = None
+
+    # --- Public Methods ---
+    def setSourceModel(self, model) -> None:
+        """Set the source gene model and follow its resets and data changes."""
+        old = self.sourceModel()
+        if old is not None:
+            old.modelAboutToBeReset.disconnect(self.beginResetModel)
+            old.modelReset.disconnect(self._on_source_reset)
+            old.dataChanged.disconnect(self._on_source_data_changed)
 
-    def set_header_mode(self, mode):
+        self.beginResetModel()
+        self._accept_key = None
+        super().setSourceModel(model)
+        if model is not None:
+            model.modelAboutToBeReset.connect(self.beginResetModel)
+            model.modelReset.connect(self._on_source_reset)
+            model.dataChanged.connect(self._on_source_data_changed)
+        self._rebuild_rows()
+        self.endResetModel()
+
+    def set_header_mode(self, mode: str) -> None:
         """Set the header mode for display (not used in sorting)."""
-        self.invalidate()
+        m = self.sourceModel()
+        if m is not None:
+            m.set_header_mode(mode)
 
     def set_deep_search(self, enabled: bool) -> None:
         """Enable or disable deep search in annotations."""
         self._deep_search = enabled
-        self.invalidateFilter()
+        self.invalidate()
+
+    def set_query(self, text: str) -> None:
+        """Set the (case-insensitive) substring used to filter genes."""
+        self._q = (text or "").lower()
+        self.invalidate()
 
     def set_sort_mode(self, text: str) -> None:
         """Set the sorting mode for the proxy model."""
         self._sort_mode = text
-        self.sort(0, Qt.DescendingOrder if text.endswith(
-            "(desc)") else Qt.AscendingOrder)
-
-    def lessThan(self, l: QModelIndex, r: QModelIndex) -> bool:
-        """Custom lessThan implementation for sorting based on the selected sort mode.
-
-        Args:
-            l (QModelIndex): Left index.
-            r (QModelIndex): Right index.
-        Returns:
-            bool: True if the left index is less than the right index, False otherwise.
-        """
+        self._key_arr_name = next(
+            (col for prefix, col in SORT_KEY_COLUMNS.items()
+             if text.startswith(prefix)), DEFAULT_SORT_KEY_COLUMN)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Recompute the visible rows, keeping persistent indexes (e.g. the selection) valid."""
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        old_sources = [self.mapToSource(idx) for idx in old]
+        self._rebuild_rows()
+        self.changePersistentIndexList(
+            old, [self.mapFromSource(src) for src in old_sources])
+        self.layoutChanged.emit()
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Return the proxy index for a row/column."""
+        if parent.isValid() or column != 0 or not 0 <= row < len(self._rows):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = None):
+        """Flat list: items have no parent (QObject.parent() without arguments)."""
+        if index is None:
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of visible genes."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns (always one)."""
+        return 0 if parent.isValid() else 1
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        """Map a proxy index to the corresponding source model index."""
         m = self.sourceModel()
-        if self._sort_mode.startswith("Annotations"):
-            return m.data(l, GeneRoles.ANN) < m.data(r, GeneRoles.ANN)
-        if self._sort_mode.startswith("GF-IDF"):
-            return m.data(l, GeneRoles.GFIDF) < m.data(r, GeneRoles.GFIDF)
-        if self._sort_mode.startswith("Symbol"):
-            return (m.data(l, GeneRoles.SYMBOL) or "").lower() < (m.data(r, GeneRoles.SYMBOL) or "").lower()
-        return (m.data(l, GeneRoles.ENTrez) or "").lower() < (m.data(r, GeneRoles.ENTrez) or "").lower()
-
-    def filterAcceptsRow(self, row: int, parent: QModelIndex) -> bool:
-        """Custom filter to include deep search in annotations if enabled.
-
-        Args:
-            row (int): Row index.
-            parent (QModelIndex): Parent index.
-        Returns:
-            bool: True if the row is accepted by the filter, False otherwise.
-        """
-        if self.filterRegExp().isEmpty():
-            return True
+        if m is None or not proxy_index.isValid():
+            return QModelIndex()
+        return m.index(int(self._rows[proxy_index.row()]), proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        """Map a source model index to the proxy index (invalid if filtered out)."""
+        if not source_index.isValid():
+            return QModelIndex()
+        row = self._proxy_rows[source_index.row()]
+        if row < 0:
+            return QModelIndex()
+        return self.createIndex(row, source_index.column())
+
+    # --- Private Methods ---
+    def _rebuild_rows(self) -> None:
+        """Filter and sort the source rows into the proxy row mapping."""
         m = self.sourceModel()
-        idx = m.index(row, 0, parent)
-        q = self.filterRegExp().pattern().lower()
+        n = m.rowCount() if m is not None else 0
+        if n == 0:
+            self._rows = np.empty(0, dtype=np.intp)
+            self._proxy_rows = []
+            return
+
+        rows = m.sort_permutation(self._key_arr_name,
+                                  descending=self._sort_mode.endswith("(desc)"))
+
+        q = self._q
+        if q:
+            key = (q, self._deep_search)
+            if self._accept_key != key:
+                accepted = m.matching_rows(q)
+                if self._deep_search:
+                    accepted = accepted | m.matching_rows(q, deep=True)
+                mask = np.zeros(n, dtype=bool)
+                mask[list(accepted)] = True
+                self._accept_key, self._accept = key, mask
+            rows = rows[self._accept[rows]]
 
-        if q in (m.data(idx, GeneRoles.SEARCH) or ""):
-            return True
+        self._rows = rows
+        proxy_rows = np.full(n, -1, dtype=np.intp)
+        proxy_rows[rows] = np.arange(len(rows))
+        self._proxy_rows = proxy_rows.tolist()
 
-        if not self._deep_search:
-            return False
+    def _on_source_reset(self) -> None:
+        """Rebuild the mapping after the source model was reset."""
+        self._accept_key = None
+        self._rebuild_rows()
+        self.endResetModel()
 
-        g = m.data(idx, GeneRoles.DATA) or {}
-        for a in (g.get("annotation_list") or []):
-            if q in str(a.get("text", "")).lower() or q in str(a.get("pubmed_id", "")).lower() or q in str(a.get("accession", "")).lower():
-                return True
-        return False
+    def _on_source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex,
+                                roles: list[int] = None) -> None:
+        """Re-filter/re-sort after source values changed (unless only display text
+        changed) and repaint the visible rows."""
+        if not roles or not DISPLAY_ONLY_ROLES.issuperset(roles):
+            self._accept_key = None
+            self.invalidate()
+        if len(self._rows):
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(self._rows) - 1, 0), roles or [])
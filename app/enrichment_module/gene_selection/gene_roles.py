@@ -1,11 +1,14 @@
 """Defines custom roles for gene data in the enrichment module"""
 
+# --- Standard Library Imports ---
+from enum import IntEnum
+
 # --- Third Party Imports ---
 from PyQt5.QtCore import Qt
 
 
 # --- Public Classes ---
-class GeneRoles:
+class GeneRoles(IntEnum):
     """Custom roles for gene data in the enrichment module."""
     SYMBOL = Qt.UserRole + 1
     ENTrez = Qt.UserRole + 2
@@ -14,3 +17,8 @@ class GeneRoles:
     TAX = Qt.UserRole + 5
     DATA = Qt.UserRole + 6
     SEARCH = Qt.UserRole + 7
+    DEEP_SEARCH = Qt.UserRole + 8
+    TITLE = Qt.UserRole + 9
+    SUBTITLE = Qt.UserRole + 10
+    CHIPS = Qt.UserRole + 11
+    CARD = Qt.UserRole + 12
@@ -2,9 +2,11 @@
 
 # --- Standard Library Imports ---
 import csv
-import json
+from contextlib import contextmanager
+from operator import itemgetter
 
 # --- Third Party Imports ---
+import numpy as np
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
     QCheckBox,
@@ -15,17 +17,15 @@ from PyQt5.QtWidgets import (
     QMenuBar,
     QSplitter,
     QStackedWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 # --- Local Imports ---
 from app.enrichment_module.gene_selection.gene_export_dialog import ExportDialog
-from app.enrichment_module.gene_selection.numeric_gene_table_item import (
-    NumericGeneTableWidgetItem,
-)
+from app.enrichment_module.gene_selection.gene_filter_proxy import GeneFilterProxy
+from app.enrichment_module.gene_selection.gene_table_model import GeneTableModel
 from app.enrichment_module.gene_selection.selected_gene_cards_widget import (
     SelectedGeneCardsWidget,
 )
@@ -39,6 +39,18 @@ from app.util_widgets.icon_line_edit import IconLineEdit
 from app.util_widgets.svg_button import SvgHoverButton
 from app.utils import get_default_html_svg, resource_path
 
+# --- Constants ---
+# filter combo entries, in order; the filter dispatches on the combo index
+FILTER_MODES = ["Gene Symbol", "Entrez ID", "Taxonomy ID", "Is Selected", "Is Not Selected"]
+# filter combo index -> text column searched by the gene table filter
+FILTER_COLUMNS = {0: 1, 1: 2, 2: 4}
+FILTER_IS_SELECTED = 3
+# delay before the filter runs, so fast typing triggers a single pass
+FILTER_DEBOUNCE_MS = 150
+# delay before checkbox changes update the selected genes, so rapid clicks coalesce
+SELECTION_DEBOUNCE_MS = 50
+# gene fields written per exported gene, in column order
+EXPORT_KEYS = ("gene_symbol", "entrez_id", "annotations", "tax_id", "gfidf")
 
 # --- Public Classes ---
 class GeneTabWidget(QStackedWidget):
@@ -59,17 +71,33 @@ class GeneTabWidget(QStackedWidget):
         self.menu_bar: QMenuBar
         self.filter_line_edit: IconLineEdit
         self.filter_combo: QComboBox
-        self.gene_list_table: QTableWidget
+        self.gene_list_table: QTableView
+        self.gene_table_model: GeneTableModel
+        self.gene_filter_proxy: GeneFilterProxy
+        self.filter_timer: QTimer
         self.export_gene_btn: SvgHoverButton
         self.select_all_genes_checkbox: QCheckBox
         self.gene_insights_box: SelectedGeneCardsWidget
         self.menu: QMenu
+        self.gene_context_menu: QMenu
+        self._context_entrez_id = "N/A"  # gene under the last right click
 
         # Gene List as a stacked page with a default 'no genes' webview.
         self.genes_tab = QSplitter()
         self.genes_tab.setFixedWidth(800)
 
         self.selected_genes: list = []
+        # checked table rows selected_genes was last built from (None: rebuild)
+        self._selected_rows: list[int] | None = None
+        # (db path, Entrez IDs) last shown in the gene insights box
+        self._insights_key: tuple | None = None
+        # False while bulk operations (un)check rows and rebuild the selection themselves
+        self._track_selection = True
+
+        self.selection_timer = QTimer(self)
+        self.selection_timer.setSingleShot(True)
+        self.selection_timer.setInterval(SELECTION_DEBOUNCE_MS)
+        self.selection_timer.timeout.connect(self._update_selected_genes)
 
         self.main_app = main_app
         self.gene_lists_view = gene_lists_view
@@ -88,64 +116,27 @@ class GeneTabWidget(QStackedWidget):
     # --- Public Methods ---
     def update(self) -> None:
         """Updates the gene list table with current gene data."""
-        # Safely disconnect signal to prevent duplicate connections
-        try:
-            self.gene_list_table.itemChanged.disconnect(
-                self._track_gene_selection)
-        except TypeError:
-            pass
-
-        self.gene_list_table.itemChanged.connect(self._track_gene_selection)
-
+        # reset, refilter and re-sort below are painted once at the end
+        self.gene_list_table.setUpdatesEnabled(False)
         self.gene_list_table.setSortingEnabled(
             False)  # Disable sorting to prevent issues
-        self.gene_list_table.clearContents()
-        self.gene_list_table.setRowCount(
-            len(self.gene_lists_view.current_gene_data))
-
-        all_tax_ids = set()
-
-        for i, (entrez_id, gene_symbol, num_annotations,
-                tax_id, gfidf,
-                annotation_list) in enumerate(self.gene_lists_view.current_gene_data):
-            checkbox_item = QTableWidgetItem()
-            checkbox_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            checkbox_item.setCheckState(Qt.Unchecked)
-            checkbox_item.setData(Qt.UserRole, {'entrez_id': entrez_id,
-                                                'gene_symbol': gene_symbol,
-                                                'tax_id': tax_id,
-                                                'annotations': int(num_annotations),
-                                                'gfidf': float(gfidf),
-                                                'annotation_list': annotation_list})
-
-            self.gene_list_table.setItem(i, 0, checkbox_item)
-            self.gene_list_table.setItem(i, 1, QTableWidgetItem(gene_symbol))
-            self.gene_list_table.setItem(
-                i, 2, QTableWidgetItem(str(entrez_id)))
-
-            num_annotations_item = NumericGeneTableWidgetItem(
-                int(num_annotations))
-            num_annotations_item.setData(Qt.UserRole, int(num_annotations))
-
-            self.gene_list_table.setItem(i, 3, num_annotations_item)
-
-            self.gene_list_table.setItem(i, 4, QTableWidgetItem(str(tax_id)))
-
-            gfidf_id_item = NumericGeneTableWidgetItem(float(gfidf))
-            gfidf_id_item.setData(Qt.UserRole, float(gfidf))
-
-            self.gene_list_table.setItem(i, 5, gfidf_id_item)
-
-            all_tax_ids.add(tax_id)
+        self.gene_table_model.reset_data(
+            self.gene_lists_view.current_gene_data)
+        self._selected_rows = None
+        self._insights_key = None  # same genes may come with new annotations
+        self._apply_gene_table_filter()
 
         self.gene_list_table.horizontalHeader().sectionClicked.disconnect()
 
-        self.gene_list_table.horizontalHeaderItem(0).setText(" ")
+        self.gene_table_model.setHeaderData(0, Qt.Horizontal, " ")
 
         self.gene_list_table.horizontalHeader().sectionClicked.connect(
             self._gene_table_handle_header_click)
         self.gene_list_table.setSortingEnabled(True)
 
+        self.gene_list_table.setUpdatesEnabled(True)
+        self.gene_list_table.viewport().update()
+
     def show_warning(self) -> None:
         """Show the no genes warning view."""
         self.setCurrentWidget(self.no_genes_warning)
@@ -184,6 +175,10 @@ class GeneTabWidget(QStackedWidget):
         """Return the gene list table."""
         return self.gene_list_table
 
+    def get_gene_table_model(self):
+        """Return the model backing the gene list table."""
+        return self.gene_table_model
+
     def get_export_gene_btn(self):
         """Return the export gene button."""
         return self.export_gene_btn
@@ -204,70 +199,71 @@ class GeneTabWidget(QStackedWidget):
 
         left_layout.addWidget(self.menu_bar)
 
-        self.filter_line_edit = IconLineEdit("filter", tooltip="Type to filter",
-                                             on_text_changed=self._apply_gene_table_filter,
-                                             icon_size=22, icon_position="right")
+        # restarted on every keystroke; the filter runs once typing pauses
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self._apply_gene_table_filter)
+
+        self.filter_line_edit = IconLineEdit(
+            "filter", tooltip="Type to filter",
+            on_return=self._apply_gene_table_filter,  # Enter applies right away
+            on_text_changed=lambda _text: self.filter_timer.start(),
+            icon_size=22, icon_position="right")
         self.filter_line_edit.setPlaceholderText("Type to filter...")
         self.filter_line_edit.setFixedHeight(30)
         self.filter_line_edit.setMinimumWidth(200)
 
         self.filter_combo = QComboBox()
-        self.filter_combo.addItems([
-            "Gene Symbol",
-            "Entrez ID",
-            "Taxonomy ID",
-            "Is Selected",
-            "Is Not Selected"
-        ])
+        self.filter_combo.addItems(FILTER_MODES)
 
         self.filter_combo.setFixedHeight(30)
 
-        # Gene List Table
-        self.gene_list_table = QTableWidget()
-        self.gene_list_table.setColumnCount(6)
-        self.gene_list_table.setHorizontalHeaderLabels(
-            [" ", "GSym", "ID", "Count", "Tax ID", "GF-IDF"])
-
-        # add tooltips to header cells
-        self.gene_list_table.horizontalHeaderItem(
-            0).setToolTip("Select or unselect genes")
-        self.gene_list_table.horizontalHeaderItem(1).setToolTip("Gene symbol")
-        self.gene_list_table.horizontalHeaderItem(2).setToolTip("Entrez ID")
-        self.gene_list_table.horizontalHeaderItem(
-            3).setToolTip("Number of annotations")
-        self.gene_list_table.horizontalHeaderItem(4).setToolTip("Taxonomy ID")
-        self.gene_list_table.horizontalHeaderItem(5).setToolTip("GF-IDF score")
+        # Gene List Table (labels and header tooltips come from the model)
+        self.gene_list_table = QTableView()
+        self.gene_table_model = GeneTableModel(self)
+        self.gene_filter_proxy = GeneFilterProxy(self)
+        self.gene_filter_proxy.setSourceModel(self.gene_table_model)
+        self.gene_list_table.setModel(self.gene_filter_proxy)
+        self.gene_table_model.dataChanged.connect(self._track_gene_selection)
 
         # a click on the first header cell triggers the selection of all genes
         self.gene_list_table.horizontalHeader().sectionClicked.connect(
             self._gene_table_handle_header_click)
 
-        self.gene_list_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
         # context menu when right click on the table, opens small window
         # where the user can select how many of the top genes to select
+        # (built once; the gene it acts on is set per right click)
+        self.gene_context_menu = QMenu(self)
+        self.gene_context_menu.addAction("Select Top Genes",
+                                         self._select_top_genes_dialog)
+        self.gene_context_menu.addAction("Select by Tax ID", self._select_by_tax_id)
+        self.gene_context_menu.addAction("Open Gene Info",
+                                         self._open_context_gene_info)
+
         self.gene_list_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.gene_list_table.customContextMenuRequested.connect(
             self._show_gene_selection_context_menu)
 
         header = self.gene_list_table.horizontalHeader()
 
-        # Per-column resize modes:
-        for c in range(self.gene_list_table.columnCount()):
-            header.setSectionResizeMode(
-                c, QHeaderView.Interactive)  # user can drag
+        # All columns (and the default for new ones): user can drag
+        header.setSectionResizeMode(QHeaderView.Interactive)
 
         # default can be ca 30–50 depending on style
         header.setMinimumSectionSize(20)
 
         # Set initial widths
         def _apply_initial_gene_col_widths():
+            # one repaint for all widths
+            self.gene_list_table.setUpdatesEnabled(False)
             self.gene_list_table.setColumnWidth(0, 40)   # checkbox
             self.gene_list_table.setColumnWidth(1, 60)   # GSym
             self.gene_list_table.setColumnWidth(2, 60)   # ID
             self.gene_list_table.setColumnWidth(3, 60)   # Count
             self.gene_list_table.setColumnWidth(4, 175)  # Tax ID
             self.gene_list_table.setColumnWidth(5, 60)  # GF-IDF
+            self.gene_list_table.setUpdatesEnabled(True)
 
         # Defer to after the widget is laid out so nothing overrides it
         QTimer.singleShot(0, _apply_initial_gene_col_widths)
@@ -276,7 +272,7 @@ class GeneTabWidget(QStackedWidget):
         self.export_gene_btn = SvgHoverButton(
             base_name="export",
             tooltip="Export Gene List",
-            triggered_func=lambda: self._export_genes(),
+            triggered_func=self._export_genes,
             size=20,
             parent=self
         )
@@ -310,9 +306,7 @@ class GeneTabWidget(QStackedWidget):
             selected_genes=None, parent=self)
         self.genes_tab.addWidget(self.gene_insights_box)
 
-        # Connect filter actions
-        self.filter_line_edit.textChanged.connect(
-            self._apply_gene_table_filter)
+        # Connect filter actions (text changes go through the debounce timer)
         self.filter_combo.currentIndexChanged.connect(
             self._apply_gene_table_filter)
 
@@ -320,38 +314,24 @@ class GeneTabWidget(QStackedWidget):
 
     def _apply_gene_table_filter(self) -> None:
         """Filter table rows based on dropdown + text input."""
-        filter_text = self.filter_line_edit.text().strip().lower()
-        filter_mode = self.filter_combo.currentText()
-
-        for row in range(self.gene_list_table.rowCount()):
-            match = False
-
-            if filter_mode == "Gene Symbol":
-                item = self.gene_list_table.item(row, 1)  # GSym
-                if item and filter_text in item.text().lower():
-                    match = True
-
-            elif filter_mode == "Entrez ID":
-                item = self.gene_list_table.item(row, 2)  # ID
-                if item and filter_text in item.text().lower():
-                    match = True
-
-            elif filter_mode == "Taxonomy ID":
-                item = self.gene_list_table.item(row, 4)  # Tax ID
-                if item and filter_text in item.text().lower():
-                    match = True
-
-            elif filter_mode == "Is Selected":
-                item = self.gene_list_table.item(row, 0)  # selection column
-                if item and item.checkState() == Qt.Checked:
-                    match = True
-
-            elif filter_mode == "Is Not Selected":
-                item = self.gene_list_table.item(row, 0)
-                if item and item.checkState() != Qt.Checked:
-                    match = True
-
-            self.gene_list_table.setRowHidden(row, not match)
+        self.filter_timer.stop()
+        mode_idx = self.filter_combo.currentIndex()
+        model = self.gene_table_model
+
+        column = FILTER_COLUMNS.get(mode_idx)
+        if column is not None:
+            needle = self.filter_line_edit.text().strip().lower()
+            mask = model.contains_mask(column, needle)
+        elif mode_idx == FILTER_IS_SELECTED:
+            mask = model.checked_mask()
+        else:  # "Is Not Selected"
+            mask = ~model.checked_mask()
+
+        # one repaint for the whole refilter (update() may already hold updates off)
+        updates_enabled = self.gene_list_table.updatesEnabled()
+        self.gene_list_table.setUpdatesEnabled(False)
+        self.gene_filter_proxy.set_accept_mask(mask)
+        self.gene_list_table.setUpdatesEnabled(updates_enabled)
 
     def _gene_table_handle_header_click(self, index: int) -> None:
         """Handle clicks on the gene table header.
@@ -368,18 +348,16 @@ class GeneTabWidget(QStackedWidget):
         Toggles all visible rows, updates header icon, and also updates
         the 'Select All Genes' checkbox without causing recursion.
         """
-        header_item = self.gene_list_table.horizontalHeaderItem(0)
-        if not header_item:
-            return
+        model = self.gene_table_model
 
         # Determine the next state from the current header icon
-        going_checked = header_item.text() == " "
+        going_checked = model.headerData(0, Qt.Horizontal) == " "
 
         # Bulk toggle rows
         self._select_all_genes(set_checked=going_checked, visible_only=True)
 
         # Update header icon
-        header_item.setText(" " if going_checked else " ")
+        model.setHeaderData(0, Qt.Horizontal, " " if going_checked else " ")
 
         # Sync the external "Select All Genes" checkbox (block its signal to avoid re-entry)
         try:
@@ -391,59 +369,71 @@ class GeneTabWidget(QStackedWidget):
     def _update_selected_genes(self):
         """Iterates over all items in the table and updates the 
         selected_genes list based on checked checkboxes."""
-        self.selected_genes = []  # Reset the list
+        if self._rebuild_selected_genes():
+            self._update_gene_insights()
 
-        selected_data = []
-        for row in range(self.gene_list_table.rowCount()):
-            item = self.gene_list_table.item(row, 0)  # Checkbox column
-            if item and item.checkState() == Qt.Checked:
-                # Retrieve stored gene data
-                selected_gene = item.data(Qt.UserRole)
-                if selected_gene:
-                    # Append the dictionary properly
-                    self.selected_genes.append(selected_gene)
-
-                    selected_data.append(selected_gene)
+    def _update_gene_insights(self) -> None:
+        """Show the current selected_genes in the gene insights box.
 
+        Skipped if the box already shows the same genes (e.g. after a gene was
+        checked and unchecked again).
+        """
+        key = (self.gene_lists_view.db_path,
+               tuple(gene['entrez_id'] for gene in self.selected_genes))
+        if key == self._insights_key:
+            return
+        self._insights_key = key
         self.gene_insights_box.update_data(genes=self.selected_genes,
                                            db_path=self.gene_lists_view.db_path)
 
-    def _track_gene_selection(self, item):
+    def _track_gene_selection(self, top_left, bottom_right, roles=None):
         """Tracks which genes are selected using checkboxes."""
-        if item.column() == 0:  # Ensure it's the checkbox column
-            self._update_selected_genes()
-
-    def _rebuild_selected_genes(self):
-        """Rebuild self.selected_genes from all checked rows."""
-        selected = []
-        for row in range(self.gene_list_table.rowCount()):
-            item = self.gene_list_table.item(row, 0)
-            if item and item.checkState() == Qt.Checked:
-                gene = item.data(Qt.UserRole)
-                if gene is not None:
-                    selected.append(gene)
-        self.selected_genes = selected
+        # Ensure it's the checkbox column and not a bulk operation
+        if self._track_selection and top_left.column() == 0:
+            self.selection_timer.start()
+
+    @contextmanager
+    def _selection_tracking_paused(self):
+        """Context in which check state changes do not trigger _update_selected_genes."""
+        previous, self._track_selection = self._track_selection, False
+        try:
+            yield
+        finally:
+            self._track_selection = previous
+
+    def _rebuild_selected_genes(self) -> bool:
+        """Rebuild self.selected_genes from all checked rows.
+
+        Gene dicts are only built here, for the checked rows.
+
+        Returns:
+            bool: False if the checked rows did not change since the last rebuild.
+        """
+        model = self.gene_table_model
+        rows = model.checked_rows()
+        if rows == self._selected_rows:
+            return False
+        self._selected_rows = rows
+        self.selected_genes = [model.gene_dict(row) for row in rows]
+        return True
 
         # User chooses what to select
 
     def _show_gene_selection_context_menu(self, pos):
         """ Opens a context menu when right clicking on the gene list table. """
-        menu = QMenu(self)
-        menu.addAction("Select Top Genes",
-                       self._select_top_genes_dialog)
-        menu.addAction("Select by Tax ID", self._select_by_tax_id)
-
         # print gene id of current row
-        current_row = self.gene_list_table.currentRow()
+        current_row = self.gene_filter_proxy.mapToSource(
+            self.gene_list_table.currentIndex()).row()
         # Assuming gene ID is in the second column
-        gene_id_item = self.gene_list_table.item(current_row, 2)
-        gene_entrez_id = "N/A"
-        if gene_id_item:
-            gene_entrez_id = gene_id_item.text()
+        self._context_entrez_id = "N/A"
+        if current_row >= 0:
+            self._context_entrez_id = self.gene_table_model.display_text(current_row, 2)
 
-        menu.addAction("Open Gene Info",
-                       lambda: self._handle_open_gene_info(gene_entrez_id))
-        menu.exec_(self.gene_list_table.viewport().mapToGlobal(pos))
+        self.gene_context_menu.exec_(self.gene_list_table.viewport().mapToGlobal(pos))
+
+    def _open_context_gene_info(self) -> None:
+        """Opens gene info for the gene the context menu was opened on."""
+        self._handle_open_gene_info(self._context_entrez_id)
 
     # dialog to set the number of top genes
     def _select_top_genes_dialog(self):
@@ -476,26 +466,26 @@ class GeneTabWidget(QStackedWidget):
 
         table = self.gene_list_table
 
-        # Temporarily silence itemChanged while toggling many items
-        try:
-            table.itemChanged.disconnect(self._track_gene_selection)
-        except TypeError:
-            pass
+        # Selection tracking is paused while toggling many items
+        with self._selection_tracking_paused():
+            table.setUpdatesEnabled(False)
+            self._apply_top_genes(top_n, visible_only, by_column, use_visual_order)
+            table.setUpdatesEnabled(True)
 
-        table.setUpdatesEnabled(False)
+    def _apply_top_genes(self, top_n: int, visible_only: bool, by_column: int,
+                         use_visual_order: bool) -> None:
+        """Check the top genes and rebuild the selection (see _select_top_genes)."""
+        model = self.gene_table_model
 
-        # Unselect only the rows to consider
-        self._select_all_genes(set_checked=False, visible_only=False)
+        # Unselect all rows (selected_genes is rebuilt once, below)
+        model.set_checked_mask(None, False)
 
-        considered_rows: list[int] = []
-        for row in range(table.rowCount()):
-            if visible_only and table.isRowHidden(row):
-                continue
-            considered_rows.append(row)
+        considered_rows: list[int] = (self.gene_filter_proxy.accepted_rows() if visible_only
+                                      else list(range(model.rowCount())))
 
         if not considered_rows:
-            table.setUpdatesEnabled(True)
-            table.itemChanged.connect(self._track_gene_selection)
+            # Nothing to check, but the unselect above must still be reflected
+            self._rebuild_selected_genes()
             return
 
         rows_to_select: list[int] = []
@@ -505,71 +495,50 @@ class GeneTabWidget(QStackedWidget):
             rows_to_select = considered_rows[:min(top_n, len(considered_rows))]
         else:
             # Compute top N by GF-IDF values in by_column among considered rows
-            scored_rows: list[tuple[float, int]] = []
-            for row in considered_rows:
-                cell = table.item(row, by_column)
-                try:
-                    score = float(cell.text()) if cell and cell.text(
-                    ).strip() else float("-inf")
-                except ValueError:
-                    score = float("-inf")
-                scored_rows.append((score, row))
-
-            # Sort descending by score
-            scored_rows.sort(key=lambda x: x[0], reverse=True)
-            rows_to_select = [
-                r for _, r in scored_rows[:min(top_n, len(scored_rows))]]
+            considered = np.array(considered_rows, dtype=np.intp)
+            scores = model.numeric_column(by_column)[considered]
+            if top_n >= len(considered):
+                rows_to_select = considered_rows
+            else:
+                # O(N) partial selection of the N-th best score; ties at that
+                # score are taken in table order (as a stable sort would)
+                kth = np.partition(scores, len(scores) - top_n)[len(scores) - top_n]
+                chosen = scores > kth
+                ties = np.flatnonzero(scores == kth)[:top_n - int(chosen.sum())]
+                chosen[ties] = True
+                rows_to_select = considered[chosen].tolist()
 
         # Apply selection
-        for row in rows_to_select:
-            item = table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.Checked)
+        model.set_checked(rows_to_select, True)
 
         # Rebuild selection list to stay consistent
         self._rebuild_selected_genes()
 
-        table.setUpdatesEnabled(True)
-        table.itemChanged.connect(self._track_gene_selection)
-
     def _select_by_tax_id(self, set_checked: bool = True) -> None:
         """Opens a pop-up to select multiple Tax IDs for selection.
 
         Args:
             set_checked (bool): If True, select genes with chosen Tax IDs; if False, unselect them.
         """
-        tax_id_list = [self.gene_list_table.item(row, 4).text(
-        ) for row in range(self.gene_list_table.rowCount())]
-
-        dialog = TaxIdSelectionDialog(tax_id_list, self)
+        model = self.gene_table_model
+        dialog = TaxIdSelectionDialog(model.unique_tax_ids(), self)
 
         if dialog.exec_():  # If user clicks OK
-            try:
-                self.gene_list_table.itemChanged.disconnect(
-                    self._track_gene_selection)
-            except TypeError:
-                pass
-
-            selected_tax_ids = dialog.selected_tax_ids
-
-            # Iterate over table rows and (un)select based on Tax ID
-            for row in range(self.gene_list_table.rowCount()):
-                tax_id_item = self.gene_list_table.item(row, 4)
-                checkbox_item = self.gene_list_table.item(row, 0)
-
-                if tax_id_item and checkbox_item and tax_id_item.text() in selected_tax_ids:
-                    if set_checked:
-                        checkbox_item.setCheckState(Qt.Checked)
-                        selected_gene = checkbox_item.data(Qt.UserRole)
-                        self.selected_genes.append(selected_gene)
-                    else:
-                        checkbox_item.setCheckState(Qt.Unchecked)
-                        selected_gene = checkbox_item.data(Qt.UserRole)
-                        self.selected_genes.remove(
-                            selected_gene)  # -= selected_gene
-
-            self.gene_list_table.itemChanged.connect(
-                self._track_gene_selection)
+            with self._selection_tracking_paused():
+                # Rows with a chosen Tax ID, (un)checked in one go
+                rows = np.flatnonzero(model.tax_mask(dialog.selected_tax_ids)).tolist()
+                model.set_checked(rows, set_checked)
+
+            # Update the selection by Entrez ID (insertion order is kept)
+            selected_by_id = {gene['entrez_id']: gene for gene in self.selected_genes}
+            for row in rows:
+                selected_gene = model.gene_dict(row)
+                if set_checked:
+                    selected_by_id[selected_gene['entrez_id']] = selected_gene
+                else:
+                    selected_by_id.pop(selected_gene['entrez_id'], None)
+            self.selected_genes = list(selected_by_id.values())
+            self._selected_rows = None
 
     def _handle_open_gene_info(self, entrez_id: str) -> None:
         """Opens gene info for the given Entrez ID.
@@ -593,29 +562,16 @@ class GeneTabWidget(QStackedWidget):
             set_checked (bool): If True, select all; if False, unselect all.
             visible_only (bool): If True, only affect currently visible rows.
         """
-        table = self.gene_list_table
-
-        # Temporarily block itemChanged while toggling many checkboxes
-        try:
-            table.itemChanged.disconnect(self._track_gene_selection)
-        except TypeError:
-            pass
-
-        for row in range(table.rowCount()):
-            if visible_only and table.isRowHidden(row):
-                continue  # skip filtered-out rows
-
-            item = table.item(row, 0)  # checkbox column
-            if not item:
-                continue
-
-            item.setCheckState(Qt.Checked if set_checked else Qt.Unchecked)
+        # Selection tracking is paused while toggling many checkboxes
+        with self._selection_tracking_paused():
+            # skip filtered-out rows if requested
+            self.gene_table_model.set_checked_mask(
+                self.gene_filter_proxy.accept_mask() if visible_only else None,
+                set_checked)
 
         # Recompute the selection list to reflect current checkbox states
         self._rebuild_selected_genes()
 
-        table.itemChanged.connect(self._track_gene_selection)
-
     def _toggle_select_all_genes(self, state) -> None:
         """
         Select/unselect all visible genes when the toolbar checkbox changes.
@@ -630,11 +586,10 @@ class GeneTabWidget(QStackedWidget):
         self._select_all_genes(set_checked=set_checked, visible_only=True)
 
         # Sync header icon
-        header_item = self.gene_list_table.horizontalHeaderItem(0)
-        if header_item is not None:
-            header_item.setText(" " if set_checked else " ")
+        self.gene_table_model.setHeaderData(
+            0, Qt.Horizontal, " " if set_checked else " ")
 
-        self._update_selected_genes()
+        self._update_gene_insights()
 
     def _set_gene_insights_box_visibility(self, visible: bool) -> None:
         """Sets the visibility of the gene insights box."""
@@ -659,36 +614,16 @@ class GeneTabWidget(QStackedWidget):
             export_format = dialog.export_format
             export_symbol = dialog.export_symbol
             export_path = dialog.export_path
-            genes_to_export: list[dict] = []
-
-            # Gather genes to export
-            if export_all:  # Export all genes
-                for row in range(self.gene_list_table.rowCount()):
-                    gene_data = {
-                        "gene_symbol": self.gene_list_table.item(row, 1).text(),
-                        "entrez_id": self.gene_list_table.item(row, 2).text(),
-                        "annotations": self.gene_list_table.item(row, 3).text(),
-                        "tax_id": self.gene_list_table.item(row, 4).text(),
-                        "gfidf": self.gene_list_table.item(row, 5).text()
-                    }
-                    genes_to_export.append(gene_data)
-            else:  # Export selected genes
-                for selected_gene in self.selected_genes:
-                    gene_data = {
-                        "gene_symbol": selected_gene["gene_symbol"],
-                        "entrez_id": selected_gene["entrez_id"],
-                        "annotations": selected_gene["annotations"],
-                        "tax_id": selected_gene["tax_id"],
-                        "gfidf": selected_gene["gfidf"]
-                    }
-
-                    genes_to_export.append(gene_data)
-
-            if genes_to_export:  # Proceed with export
+            num_genes = (self.gene_table_model.rowCount() if export_all
+                         else len(self.selected_genes))
+
+            if num_genes:  # Proceed with export
                 # Ensure correct file extension
                 if not export_path.endswith(f".{export_format}"):
                     export_path += f".{export_format}"
 
+                rows = self._iter_export_rows(export_all)
+
                 # Export based on chosen format
                 if export_format in ["csv", "tsv"]:
                     with open(export_path, "w", newline="", encoding='utf-8') as file:
@@ -697,23 +632,37 @@ class GeneTabWidget(QStackedWidget):
                             writer = csv.writer(file)
                         writer.writerow(
                             ["Gene Symbol", "Entrez ID", "Annotations", "Tax ID", "GF-IDF"])
-                        for gene in genes_to_export:
-                            if export_symbol:
-                                writer.writerow([gene["gene_symbol"]])
-                            else:
-                                writer.writerow(
-                                    [gene["gene_symbol"], gene["entrez_id"],
-                                     gene["annotations"], gene["tax_id"], gene["gfidf"]])
+                        if export_symbol:
+                            writer.writerows(row[:1] for row in rows)
+                        else:
+                            writer.writerows(rows)
 
                 elif export_format == "txt":
                     with open(export_path, "w", encoding='utf-8') as file:
-                        for gene in genes_to_export:
-                            if export_symbol:
-                                file.write(f"{gene['gene_symbol']}\n")
-                            else:
-                                file.write(
-                                    f"{gene['gene_symbol']}, {gene['entrez_id']}, {gene['annotations']}, {gene['tax_id']}, {gene['gfidf']}\n")
+                        if export_symbol:
+                            file.writelines(f"{row[0]}\n" for row in rows)
+                        else:
+                            file.writelines(
+                                f"{', '.join(map(str, row))}\n" for row in rows)
 
                 elif export_format == "json":
-                    with open(export_path, "w", encoding='utf-8') as file:
-                        json.dump(genes_to_export, file, indent=4)
+                    dialog.dump_json([dict(zip(EXPORT_KEYS, row)) for row in rows],
+                                     export_path)
+
+    def _iter_export_rows(self, export_all: bool):
+        """Yield (gene_symbol, entrez_id, annotations, tax_id, gfidf) per exported gene.
+
+        Args:
+            export_all (bool): Export all genes (cell texts in table order) instead
+                of the selected genes.
+        Yields:
+            tuple: One row per gene, in EXPORT_KEYS order.
+        """
+        if export_all:
+            cell = self.gene_table_model.display_text
+            for row in range(self.gene_table_model.rowCount()):
+                yield (cell(row, 1), cell(row, 2), cell(row, 3), cell(row, 4), cell(row, 5))
+        else:
+            get_fields = itemgetter(*EXPORT_KEYS)
+            for gene in self.selected_genes:
+                yield get_fields(gene)
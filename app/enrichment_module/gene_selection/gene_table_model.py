@@ -0,0 +1,350 @@
+"""Provides a Qt table model for the gene list in the gene selection tab"""
+
+# --- Third Party Imports ---
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# --- Constants ---
+GENE_TABLE_HEADERS = [" ", "GSym", "ID", "Count", "Tax ID", "GF-IDF"]
+GENE_TABLE_TOOLTIPS = ["Select or unselect genes", "Gene symbol", "Entrez ID",
+                       "Number of annotations", "Taxonomy ID", "GF-IDF score"]
+
+
+# --- Public Classes ---
+class GeneTableModel(QAbstractTableModel):
+    """Table model for the gene list, storing one array/list per column.
+
+    Only the visible cells are requested by the view, so loading a gene list
+    costs one pass over the data instead of one table item per cell. The
+    columns stay in load order; sorting only replaces the row permutation
+    that maps table rows to stored rows. All public row arguments are table
+    rows.
+    """
+
+    def __init__(self, parent=None):
+        """Table model for the gene list.
+
+        Args:
+            parent (QObject, optional): Parent QObject. Defaults to None.
+        """
+        super().__init__(parent)
+        self._headers: list[str] = list(GENE_TABLE_HEADERS)
+        self._set_columns([])
+
+    # --- Public Methods ---
+    def reset_data(self, gene_data: list[list]) -> None:
+        """Replace the table content.
+
+        Args:
+            gene_data (list[list]): Rows of (entrez_id, gene_symbol, num_annotations,
+                tax_id, gfidf, annotation_list) as built by the enrichment module view.
+        """
+        self.beginResetModel()
+        self._set_columns(gene_data)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of genes."""
+        return 0 if parent.isValid() else len(self._symbols)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        """Return data for a given index and role."""
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole and col != 0:
+            # served as text: an int would be shown with locale group separators
+            # ("12,345"), unlike the text the filter and the exports use
+            return self.display_text(row, col)
+        if col == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self.is_checked(row) else Qt.Unchecked
+            if role == Qt.UserRole:
+                return self.gene_dict(row)
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        """Toggle the check state of a gene (first column only)."""
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        self._checked[self._perm_list[index.row()]] = value == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Return item flags: a checkbox in the first column, read-only text elsewhere."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.DisplayRole) -> object:
+        """Return the column labels/tooltips and 1-based row numbers."""
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole:
+                return self._headers[section]
+            if role == Qt.ToolTipRole:
+                return GENE_TABLE_TOOLTIPS[section]
+        elif role == Qt.DisplayRole:
+            return section + 1
+        return None
+
+    def setHeaderData(self, section: int, orientation: Qt.Orientation, value,
+                      role: int = Qt.EditRole) -> bool:
+        """Change a column label (used for the select-all column)."""
+        if orientation != Qt.Horizontal or role not in (Qt.DisplayRole, Qt.EditRole):
+            return False
+        self._headers[section] = str(value)
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """Stably sort the rows by a column (the checkbox column keeps the current order)."""
+        new_order = self.sort_order(column, order)
+        if new_order is not None:
+            self.apply_row_order(new_order)
+
+    def sort_order(self, column: int,
+                   order: Qt.SortOrder = Qt.AscendingOrder) -> np.ndarray | None:
+        """Return the stable row order for sorting by a column, without applying it.
+
+        The stored column is argsorted once with numpy; ties keep the load order.
+
+        Args:
+            column (int): Column index.
+            order (Qt.SortOrder): Sort order.
+        Returns:
+            np.ndarray | None: Current table row for every new row position, or
+                None if the column is not sortable.
+        """
+        if column <= 0 or len(self._symbols) == 0:
+            return None
+        key = self._sort_key(column)
+
+        if order == Qt.DescendingOrder:
+            # stable descending: argsort the reversed keys, then undo the reversal
+            n = len(key)
+            new_perm = (n - 1 - np.argsort(key[::-1], kind="stable"))[::-1]
+        else:
+            new_perm = np.argsort(key, kind="stable")
+        return self._inv_perm[new_perm]
+
+    def set_checked_mask(self, mask: np.ndarray | None, checked: bool) -> None:
+        """Set the check state of the rows in a mask (all rows if None) in one write.
+
+        Args:
+            mask (np.ndarray | None): Boolean mask over the rows, or None for all rows.
+            checked (bool): New check state.
+        """
+        n = len(self._symbols)
+        if n == 0:
+            return
+        if mask is None:
+            self._checked[:] = checked
+        else:
+            self._checked[self._perm[mask]] = checked
+        self.dataChanged.emit(self.index(0, 0), self.index(n - 1, 0),
+                              [Qt.CheckStateRole])
+
+    def apply_row_order(self, new_order: np.ndarray) -> None:
+        """Reorder the rows (new_order[new_row] = old_row) and keep persistent indexes.
+
+        Args:
+            new_order (np.ndarray): Current table row for every new row position.
+        """
+        self.layoutAboutToBeChanged.emit()
+        self._set_perm(self._perm[new_order])
+
+        new_pos = np.empty(len(new_order), dtype=np.intp)
+        new_pos[new_order] = np.arange(len(new_order))
+        old = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old, [self.index(int(new_pos[idx.row()]), idx.column()) if idx.isValid()
+                  else QModelIndex() for idx in old])
+        self.layoutChanged.emit()
+
+    def display_text(self, row: int, column: int) -> str:
+        """Return the text shown in a cell.
+
+        Args:
+            row (int): Row index.
+            column (int): Column index.
+        Returns:
+            str: Cell text ("" for the checkbox column).
+        """
+        return self._cell_text(self._perm_list[row], column)
+
+    def gene_dict(self, row: int) -> dict:
+        """Return the gene of a row as a dict (built on demand).
+
+        Args:
+            row (int): Row index.
+        Returns:
+            dict: Gene with entrez_id, gene_symbol, tax_id, annotations, gfidf
+                and annotation_list.
+        """
+        i = self._perm_list[row]
+        return {'entrez_id': self._entrez[i],
+                'gene_symbol': self._symbols[i],
+                'tax_id': self._tax[i],
+                'annotations': int(self._counts[i]),
+                'gfidf': float(self._gfidf[i]),
+                'annotation_list': self._annotation_lists[i]}
+
+    def numeric_column(self, column: int) -> np.ndarray:
+        """Return the values of a column as floats, in table order.
+
+        Args:
+            column (int): Column index (3: count, 5: GF-IDF; other columns are
+                parsed from their text, -inf where that is not a number).
+        Returns:
+            np.ndarray: One float64 value per row.
+        """
+        if column in (3, 5):
+            return self._sort_key(column)[self._perm].astype(np.float64)
+        return np.array([_to_float(self.display_text(row, column))
+                         for row in range(len(self._symbols))], dtype=np.float64)
+
+    def contains_mask(self, column: int, needle: str) -> np.ndarray:
+        """Return which rows contain a lowercase substring in a text column.
+
+        Args:
+            column (int): Column index (1: symbol, 2: Entrez ID, 4: Tax ID).
+            needle (str): Lowercase substring ("" matches every row).
+        Returns:
+            np.ndarray: Boolean mask over the rows.
+        """
+        lower = self._lower[column]
+        last = self._last_find
+        if last is not None and last[0] == column and last[1] in needle:
+            # the needle extends the previous one (typing): only its matches can match
+            rows = np.flatnonzero(last[2])
+            found = np.zeros(len(lower), dtype=bool)
+            found[rows] = np.char.find(lower[rows], needle) >= 0
+        else:
+            found = np.char.find(lower, needle) >= 0
+        self._last_find = (column, needle, found)
+        return found[self._perm]
+
+    def unique_tax_ids(self) -> tuple[str, ...]:
+        """Return the distinct Tax IDs of the loaded genes, sorted."""
+        return self._tax_ids
+
+    def tax_mask(self, tax_ids: set[str]) -> np.ndarray:
+        """Return which rows have one of the given Tax IDs.
+
+        Args:
+            tax_ids (set[str]): Tax IDs as shown in the table.
+        Returns:
+            np.ndarray: Boolean mask over the rows.
+        """
+        codes = [code for code, tax_id in enumerate(self._tax_ids) if tax_id in tax_ids]
+        return np.isin(self._tax_codes, codes)[self._perm]
+
+    def checked_mask(self) -> np.ndarray:
+        """Return the check state of all rows as a (new) boolean mask."""
+        return self._checked[self._perm]
+
+    def is_checked(self, row: int) -> bool:
+        """Return whether the gene in a row is checked."""
+        return bool(self._checked[self._perm_list[row]])
+
+    def checked_rows(self) -> list[int]:
+        """Return the checked rows in table order."""
+        return np.flatnonzero(self._checked[self._perm]).tolist()
+
+    def set_checked(self, rows, checked: bool) -> None:
+        """Set the check state of several rows and notify the view once.
+
+        Args:
+            rows: Iterable of row indices.
+            checked (bool): New check state.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        self._checked[self._perm[rows]] = checked
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0),
+                              [Qt.CheckStateRole])
+
+    # --- Private Methods ---
+    def _set_columns(self, gene_data: list[list]) -> None:
+        """Split the gene rows into per-column storage."""
+        n = len(gene_data)
+        # one C-level transpose into columns instead of a pass per field
+        entrez, symbols, counts, tax, gfidf, annotation_lists = (
+            zip(*gene_data) if n else ((),) * 6)
+        # ID and count columns are converted to text once here, not per painted cell
+        self._entrez: list[str] = list(map(str, entrez))
+        # genes without a symbol show an empty cell (symbols may be NULL)
+        self._symbols: list[str] = [s or "" for s in symbols]
+        self._counts = np.array(counts, dtype=np.int64)
+        self._count_texts: list[str] = list(map(str, self._counts.tolist()))
+        self._tax: list[str] = list(map(str, tax))
+        self._gfidf = np.array(gfidf, dtype=np.float64)
+        self._annotation_lists: list[list] = list(annotation_lists)
+        self._checked = np.zeros(n, dtype=bool)
+        self._set_perm(np.arange(n, dtype=np.intp))
+        # lowercase text columns searched by contains_mask()
+        self._lower: dict[int, np.ndarray] = {
+            column: np.array([self._cell_text(i, column).lower() for i in range(n)],
+                             dtype=str)
+            for column in (1, 2, 4)}
+        # (column, needle, stored-row mask) of the last contains_mask() call
+        self._last_find: tuple[int, str, np.ndarray] | None = None
+        self._sort_keys: dict[int, np.ndarray] = {}  # text sort keys, built on first sort
+        # Tax IDs as sorted distinct values plus one code per stored row
+        tax_ids, self._tax_codes = np.unique(
+            np.array([self._cell_text(i, 4) for i in range(n)], dtype=str),
+            return_inverse=True)
+        self._tax_ids: tuple[str, ...] = tuple(tax_ids.tolist())
+
+    def _set_perm(self, perm: np.ndarray) -> None:
+        """Set the table row -> stored row permutation and its inverse."""
+        self._perm = perm
+        self._perm_list: list[int] = perm.tolist()  # fast scalar lookups in data()
+        self._inv_perm = np.empty_like(perm)
+        self._inv_perm[perm] = np.arange(len(perm))
+
+    def _sort_key(self, column: int) -> np.ndarray:
+        """Return the stored (load order) values a column is sorted by."""
+        if column == 3:
+            return self._counts
+        if column == 5:
+            return self._gfidf
+        key = self._sort_keys.get(column)
+        if key is None:
+            key = np.array([self._cell_text(i, column) for i in range(len(self._symbols))])
+            if column == 2 and all(map(str.isdigit, self._entrez)):
+                key = key.astype(np.int64)  # Entrez IDs sort numerically
+            self._sort_keys[column] = key
+        return key
+
+    def _cell_text(self, i: int, column: int) -> str:
+        """Return the text of a cell by stored row."""
+        if column == 1:
+            return self._symbols[i]
+        if column == 2:
+            return self._entrez[i]
+        if column == 3:
+            return self._count_texts[i]
+        if column == 4:
+            return self._tax[i]
+        if column == 5:
+            return str(float(self._gfidf[i]))
+        return ""
+
+
+# --- Private Functions ---
+def _to_float(text: str) -> float:
+    """Parse a cell text as float (-inf if it is empty or not a number)."""
+    try:
+        return float(text) if text.strip() else float("-inf")
+    except ValueError:
+        return float("-inf")
@@ -1,15 +1,39 @@
 """Computes GF-IDF scores for genes based on their annotations in articles"""
 
 # --- Standard Library Imports ---
+import atexit
 import math
+from operator import itemgetter
 import sqlite3
 
+# --- Third Party Imports ---
+import numpy as np
+import orjson
+
 # --- Local Imports ---
 from app.utils import resource_path
 
 # --- Constants ---
 # get_total_pubtator_articles_with_genes()
 TOTAL_PUBTATOR_ARTICLE_COUNT_WITH_GENES = 8562517
+# log(size_P + 1), the constant part of every IDF: log((size_P + 1) / (freq_g_P + 1))
+LOG_TOTAL_PLUS_1 = math.log(TOTAL_PUBTATOR_ARTICLE_COUNT_WITH_GENES + 1)
+# counts of a JSON array of identifiers; one constant SQL string, so the
+# connection's statement cache compiles it once (see _query_counts)
+COUNTS_QUERY = ("SELECT Identifier, Count FROM IdentifierCounts "
+                "WHERE Identifier IN (SELECT value FROM json_each(?))")
+# read-only tuning for the static count database (see _get_connection)
+COUNT_DB_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB memory-mapped reads
+    "PRAGMA cache_size = -65536",  # 64 MiB page cache
+    "PRAGMA temp_store = MEMORY",
+)
+
+_connection: sqlite3.Connection | None = None
+# Identifier -> article count (0 if not in the database); the database is static,
+# so entries never go stale and genes seen before are not queried again
+_count_cache: dict[str, int] = {}
 
 
 # --- Public Functions ---
@@ -30,58 +54,101 @@ def compute_gfidf(gene_data: list[tuple[str, str, int, str, list[str]]]) -> dict
     - GF-IDF score.
     """
 
-    entrez_id_to_gfidf_map = {}
-
-    # Total articles with at least one gene annotation
-    total_articles = TOTAL_PUBTATOR_ARTICLE_COUNT_WITH_GENES
+    entrez_ids = list(map(itemgetter(0), gene_data))
+    # Number of mentions of each gene across all articles
+    freq_g_A = np.fromiter(map(itemgetter(2), gene_data), dtype=np.int64,
+                           count=len(gene_data))
     # Total gene mentions across all articles
-    freq_G_A = sum([x[2] for x in gene_data])
+    freq_G_A = int(freq_g_A.sum())
 
     # Avoid computation if there are no gene mentions
     if freq_G_A == 0:
         return {}
 
-    # Compute GF-IDF for each gene
-    for (entrez_id, _, num_annotations, _, _) in gene_data:
-        gene_identifier = entrez_id
-        freq_g_A = num_annotations
-        # Get the actual count for this gene
-        freq_g_P = _get_identifier_count(gene_identifier)
+    # Get the actual counts for all genes at once; genes without mentions in A
+    # score 0 whatever their count in P, so they are not looked up
+    identifier_counts = _get_identifier_counts(
+        [entrez_id for entrez_id, mentions in zip(entrez_ids, freq_g_A.tolist()) if mentions])
+    freq_g_P = np.fromiter((identifier_counts.get(str(entrez_id), 0) for entrez_id in entrez_ids),
+                           dtype=np.int64, count=len(entrez_ids))
 
-        # Avoid division by zero
-        term_frequency = freq_g_A / freq_G_A if freq_G_A != 0 else 0
+    # Compute GF-IDF for all genes at once; the IDF buffer is reused in place
+    # for the product and the rounding, so only two float arrays are allocated
+    term_frequency = freq_g_A * (1.0 / freq_G_A)
 
-        # IDF calculation to prevent negative values
-        inverse_document_frequency = math.log(
-            (total_articles + 1) / (freq_g_P + 1))  # Ensuring positive IDF
+    # IDF calculation to prevent negative values (log1p(x) = log(x + 1))
+    gfidf = np.log1p(freq_g_P)
+    np.subtract(LOG_TOTAL_PLUS_1, gfidf, out=gfidf)  # Ensuring positive IDF
 
-        entrez_id_to_gfidf_map[entrez_id] = round(
-            term_frequency * inverse_document_frequency, 3)
+    np.multiply(term_frequency, gfidf, out=gfidf)
+    np.round(gfidf, 3, out=gfidf)
 
-    return entrez_id_to_gfidf_map
+    return dict(zip(entrez_ids, gfidf.tolist()))
 
 
 # --- Private Functions ---
-def _get_identifier_count(identifier: str) -> int:
-    """Fetches the count of a given Identifier from the small SQLite3 database.
+def _get_identifier_counts(identifiers: list[str]) -> dict[str, int]:
+    """Fetches the counts of the given Identifiers from the small SQLite3 database.
+
+    Counts are cached for the session; only identifiers not looked up before
+    are queried, over one connection (see _query_counts).
 
     Args:
-        identifier (str): The gene identifier (e.g., Entrez ID).
+        identifiers (list[str]): The gene identifiers (e.g., Entrez IDs).
     Returns:
-        int: The count of articles mentioning the identifier.
+        dict[str, int]: Count of articles mentioning each identifier (0 if it
+            is not in the database), keyed by the identifier as text.
     """
-    conn = sqlite3.connect(resource_path(
-        "assets/external_data/pubtator_count.db"))
-    cursor = conn.cursor()
+    identifiers = [str(identifier) for identifier in identifiers]
+    missing = [identifier for identifier in dict.fromkeys(identifiers)
+               if identifier not in _count_cache]
 
-    cursor.execute(
-        "SELECT Count FROM IdentifierCounts WHERE Identifier = ?", (identifier,))
-    result = cursor.fetchone()
+    if missing:
+        found = {str(identifier): count
+                 for identifier, count in _query_counts(missing)}
+        _count_cache.update((identifier, found.get(identifier, 0))
+                            for identifier in missing)
 
-    conn.close()
+    return {identifier: _count_cache[identifier] for identifier in identifiers}
 
-    # Return count if found, otherwise return 0
-    return result[0] if result else 0
+
+def _query_counts(identifiers: list[str]) -> list[tuple]:
+    """Queries the (Identifier, Count) rows of the given identifiers.
+
+    The identifiers are bound as a single JSON array and expanded by SQLite's
+    json_each, so every lookup, whatever its size, runs the same prepared
+    statement (COUNTS_QUERY) instead of an IN (...) list with one placeholder
+    per identifier.
+
+    Args:
+        identifiers (list[str]): Distinct gene identifiers.
+    Returns:
+        list[tuple]: (Identifier, Count) rows of the identifiers found.
+    """
+    return _get_connection().execute(
+        COUNTS_QUERY, (orjson.dumps(identifiers).decode(),)).fetchall()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Returns the shared read-only connection to the count database.
+
+    The database ships with the application and never changes, so it is
+    opened once in immutable read-only mode (no locking or journal checks)
+    and closed at interpreter exit.
+
+    Returns:
+        sqlite3.Connection: The connection.
+    """
+    global _connection
+    if _connection is None:
+        db_uri = resource_path(
+            "assets/external_data/pubtator_count.db").as_uri()
+        _connection = sqlite3.connect(f"{db_uri}?mode=ro&immutable=1", uri=True,
+                                      check_same_thread=False)
+        for pragma in COUNT_DB_PRAGMAS:
+            _connection.execute(pragma)
+        atexit.register(_connection.close)
+    return _connection
 
 
 '''
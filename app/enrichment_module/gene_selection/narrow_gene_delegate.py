@@ -1,23 +1,37 @@
 """Provides a custom delegate for rendering narrow gene rows in the gene selection list"""
 
 # --- Third Party Imports ---
-from PyQt5.QtCore import QModelIndex, QSize, Qt
-from PyQt5.QtGui import QFont, QFontMetrics, QPainter
+from PyQt5.QtCore import QModelIndex, QPoint, QSize, Qt
+from PyQt5.QtGui import QFont, QFontMetrics, QPainter, QStaticText, QTransform
 from PyQt5.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
 
 # --- Local Imports ---
 from app.enrichment_module.gene_selection.gene_roles import GeneRoles
 
+# --- Constants ---
+# plain int role values, bound once for the per-row paint path
+CARD_ROLE = int(GeneRoles.CARD)
+# laid-out card lines kept by the delegate before its cache is emptied
+STATIC_TEXT_CACHE_SIZE = 4096
+
+
 # --- Public Classes ---
 
 
 class NarrowGeneDelegate(QStyledItemDelegate):
     """Delegate for rendering narrow gene rows in the gene selection list."""
 
-    def __init__(self, get_header_mode, parent=None):
+    def __init__(self, parent=None):
         """Delegate for rendering narrow gene rows in the gene selection list."""
         super().__init__(parent)
-        self._get_header_mode = get_header_mode
+        # bold font and font metrics of the last seen option font (see _fonts)
+        self._font_key: str | None = None
+        self._font: QFont | None = None
+        self._bold_font: QFont | None = None
+        self._fm: QFontMetrics | None = None
+        self._fm_b: QFontMetrics | None = None
+        # (elided text, bold) -> QStaticText laid out for the current fonts
+        self._static_texts: dict[tuple[str, bool], QStaticText] = {}
 
     def paint(self, p: QPainter, opt: QStyleOptionViewItem, idx: QModelIndex) -> None:
         """Custom paint method to render gene information in a card-like style.
@@ -36,42 +50,29 @@ class NarrowGeneDelegate(QStyledItemDelegate):
         p.setPen(opt.palette.mid().color())
         p.drawRoundedRect(r, 6, 6)
 
-        # Fetch gene data
-        m = idx.model()
-        sym = m.data(idx, GeneRoles.SYMBOL) or ""
-        ent = m.data(idx, GeneRoles.ENTrez) or ""
-        ann = m.data(idx, GeneRoles.ANN) or 0
-        gfidf = m.data(idx, GeneRoles.GFIDF) or 0.0
-        tax = m.data(idx, GeneRoles.TAX) or ""
-
-        # Prepare text
-        header_mode = self._get_header_mode()
-        title = sym if header_mode == "Symbol" else ent if header_mode == "Entrez ID" else (
-            f"{sym} • {ent}" if (sym and ent) else (sym or ent or "(gene)"))
-        subtitle = f"{ann} ann  -  GF-IDF {gfidf:.3f}"
-        tax_s = str(tax)
-        if len(tax_s) > 22:
-            tax_s = tax_s[:20] + "…"
+        # Fetch the card text in one call (formatted once by the model, see GeneCard)
+        card = idx.model().data(idx, CARD_ROLE)
+        title, subtitle, tax_s = card if card is not None else ("", "", "")
 
         # Draw text
         pad = 10
         inner = r.adjusted(pad, pad, -pad, -pad)
-        fm_b = QFontMetrics(self._bold(opt.font))
-        fm = QFontMetrics(opt.font)
+        bold, fm, fm_b = self._fonts(opt.font)
         title = fm_b.elidedText(title, Qt.ElideRight, inner.width())
         subtitle = fm.elidedText(subtitle, Qt.ElideRight, inner.width())
         chips = fm.elidedText(tax_s, Qt.ElideRight, inner.width())
 
-        # Render text
-        p.setFont(self._bold(opt.font))
+        # Render text (glyph layout is cached per line, see _static_text)
+        x, y = inner.left(), inner.top()
+        p.setFont(bold)
         p.setPen(opt.palette.text().color())
-        p.drawText(inner, Qt.AlignLeft | Qt.AlignTop, title)
+        p.drawStaticText(QPoint(x, y), self._static_text(title, True))
         p.setFont(opt.font)
         p.setPen(opt.palette.mid().color())
-        p.drawText(inner.adjusted(0, fm_b.height()+4, 0, 0),
-                   Qt.AlignLeft | Qt.AlignTop, subtitle)
-        p.drawText(inner.adjusted(0, fm_b.height()+fm.height() +
-                   8, 0, 0), Qt.AlignLeft | Qt.AlignTop, chips)
+        p.drawStaticText(QPoint(x, y + fm_b.height() + 4),
+                         self._static_text(subtitle, False))
+        p.drawStaticText(QPoint(x, y + fm_b.height() + fm.height() + 8),
+                         self._static_text(chips, False))
         p.restore()
 
     def sizeHint(self, opt: QStyleOptionViewItem, idx: QModelIndex) -> QSize:
@@ -83,12 +84,52 @@ class NarrowGeneDelegate(QStyledItemDelegate):
         Returns:
             QSize: Size hint for the item.
         """
-        fh = QFontMetrics(opt.font).height()
+        fh = self._fonts(opt.font)[1].height()
         # slightly taller to increase spacing between rows at ca 500px width
         return QSize(opt.rect.width(), 4 + 3*fh + 24)
 
-    def _bold(self, f: QFont) -> QFont:
-        """Return a bold version of the given font."""
-        fb = QFont(f)
-        fb.setBold(True)
-        return fb
+    def _fonts(self, f: QFont) -> tuple[QFont, QFontMetrics, QFontMetrics]:
+        """Return the bold font and the metrics of the font and its bold version.
+
+        They are built once and reused until the option font changes.
+
+        Args:
+            f (QFont): Font of the style option.
+        Returns:
+            tuple[QFont, QFontMetrics, QFontMetrics]: Bold font, metrics of the
+                font, metrics of the bold font.
+        """
+        key = f.key()
+        if key != self._font_key:
+            bold = QFont(f)
+            bold.setBold(True)
+            self._font_key = key
+            self._font = QFont(f)
+            self._bold_font = bold
+            self._fm = QFontMetrics(f)
+            self._fm_b = QFontMetrics(bold)
+            self._static_texts.clear()
+        return self._bold_font, self._fm, self._fm_b
+
+    def _static_text(self, text: str, bold: bool) -> QStaticText:
+        """Return a QStaticText for a card line, laid out once for the current fonts.
+
+        Repainting a row (e.g. while scrolling) then reuses the shaped glyphs
+        instead of laying out the text again on every drawText call.
+
+        Args:
+            text (str): Elided line text.
+            bold (bool): Whether the line is drawn in the bold font.
+        Returns:
+            QStaticText: Prepared static text.
+        """
+        key = (text, bold)
+        static = self._static_texts.get(key)
+        if static is None:
+            if len(self._static_texts) >= STATIC_TEXT_CACHE_SIZE:
+                self._static_texts.clear()
+            static = QStaticText(text)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(QTransform(), self._bold_font if bold else self._font)
+            self._static_texts[key] = static
+        return static
@@ -1,18 +1,22 @@
 """Provides a custom QTableWidgetItem for numeric sorting in gene selection tables"""
 
 # --- Third Party Imports ---
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QTableWidgetItem
 
 
 # --- Public Classes ---
 class NumericGeneTableWidgetItem(QTableWidgetItem):
-    """Custom QTableWidgetItem to force numerical sorting."""
+    """Custom QTableWidgetItem to force numerical sorting.
 
-    def __init__(self, value):
-        super().__init__(str(value))
-        self.value = value  # Store the numeric value
+    The number is stored as the item's DisplayRole data (a double QVariant), so
+    QTableWidget sorts the column with Qt's own numeric comparison instead of
+    calling back into Python for every comparison.
+    """
+
+    __slots__ = ("value",)
 
-    def __lt__(self, other):
-        if isinstance(other, NumericGeneTableWidgetItem):
-            return self.value < other.value
-        return super().__lt__(other)
+    def __init__(self, value):
+        super().__init__()
+        self.value = float(value)  # numeric value, also the sort key
+        self.setData(Qt.DisplayRole, self.value)
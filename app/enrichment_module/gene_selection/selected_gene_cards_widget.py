@@ -1,16 +1,22 @@
 """Provides a widget for displaying selected genes as cards with details and sections"""
 
 # --- Standard Library Imports ---
+from collections import OrderedDict
+import os
+from pathlib import Path
 import sqlite3
 
 # --- Third Party Imports ---
-from PyQt5.QtCore import QModelIndex, Qt, pyqtSignal
+import numpy as np
+import orjson
+from PyQt5.QtCore import QModelIndex, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication,
     QCheckBox,
     QComboBox,
     QFrame,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QListView,
@@ -18,18 +24,56 @@ from PyQt5.QtWidgets import (
     QScrollArea,
     QSizePolicy,
     QStackedLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 # --- Local Imports ---
+from app.enrichment_module.gene_selection.annotation_table_model import AnnotationTableModel
+from app.enrichment_module.gene_selection.doc_card_delegate import DocCardDelegate
+from app.enrichment_module.gene_selection.doc_card_model import DocCardModel
 from app.enrichment_module.gene_selection.gene_list_model import GeneListModel
 from app.enrichment_module.gene_selection.gene_proxy import GeneProxy
 from app.enrichment_module.gene_selection.gene_roles import GeneRoles
 from app.enrichment_module.gene_selection.narrow_gene_delegate import NarrowGeneDelegate
 
+# --- Constants ---
+# annotation rows measured when sizing the annotation table's columns
+ANNOTATION_RESIZE_SAMPLE_ROWS = 200
+# delay before the gene / section filters run, so fast typing triggers a single pass
+FILTER_DEBOUNCE_MS = 150
+# genes whose grouped sections are kept (least recently opened are dropped first)
+SECTIONS_CACHE_SIZE = 32
+
+# per-section mention counts of a gene; {COND} selects its annotations
+SECTIONS_QUERY_TEMPLATE = """
+    SELECT a.pubmed_id, ar.title,
+           a.passage_number, p.section_type, p.type, p.passage_text,
+           COUNT(*) as mention_count
+    FROM annotations a
+    JOIN passages p ON a.pubmed_id = p.pubmed_id AND a.passage_number = p.passage_number
+    LEFT JOIN articles ar ON ar.pubmed_id = a.pubmed_id
+    WHERE {COND}
+    GROUP BY a.pubmed_id, a.passage_number
+    ORDER BY a.pubmed_id, a.passage_number
+"""
+# the three lookups of _fetch_sections_grouped_for_gene, formatted once; each
+# is a constant SQL string, so the cached connection reuses its compiled plan
+SECTIONS_BY_ENTITY_SQL = SECTIONS_QUERY_TEMPLATE.format(COND="a.entity_id = ?")
+SECTIONS_BY_ACCESSIONS_SQL = SECTIONS_QUERY_TEMPLATE.format(
+    COND="a.accession IN (SELECT value FROM json_each(?))")
+SECTIONS_BY_SYMBOL_SQL = SECTIONS_QUERY_TEMPLATE.format(COND="""a.entity_id IN (
+        SELECT e.entity_id FROM entities e
+        WHERE e.biotype='gene'
+        AND (e.name=? OR e.accession=?)
+    )""")
+# tuning for the read-only sections connection (see _sections_conn)
+SECTIONS_DB_PRAGMAS = (
+    "PRAGMA cache_size = -65536",  # 64 MiB page cache
+    "PRAGMA temp_store = MEMORY",
+)
+
 
 # # --- Public Classes ---
 class SelectedGeneCardsWidget(QWidget):
@@ -49,8 +93,13 @@ class SelectedGeneCardsWidget(QWidget):
         super().__init__(parent)
         self._data: list[str] = selected_genes or []
         self._db_path: str = None
+        self._db_conn: sqlite3.Connection = None  # opened on first sections query
         self._current_gene: dict = None
         self._last_grouped_sections: list[dict] = None  # cache for filtering
+        # (entrez id, accessions, symbol) -> grouped sections, valid for the
+        # database path and modification time in _sections_cache_stamp
+        self._sections_cache: OrderedDict[tuple, dict] = OrderedDict()
+        self._sections_cache_stamp: tuple[str, float] | None = None
 
         self.stack = QStackedLayout(self)
 
@@ -176,16 +225,16 @@ class SelectedGeneCardsWidget(QWidget):
         cbl.addStretch(1)
         sections_layout.addWidget(self.sections_chips)
 
-        # scrollable card container
-        self.sections_scroll = QScrollArea(sections_page)
-        self.sections_scroll.setWidgetResizable(True)
-        self.sections_container = QFrame(self.sections_scroll)
-        self.sections_cards_layout = QVBoxLayout(self.sections_container)
-        self.sections_cards_layout.setContentsMargins(12, 12, 12, 12)
-        self.sections_cards_layout.setSpacing(18)
-        self.sections_cards_layout.addStretch(1)
-        self.sections_scroll.setWidget(self.sections_container)
-        sections_layout.addWidget(self.sections_scroll, 1)
+        # document cards, painted by DocCardDelegate for the visible rows only
+        self.sections_view = QListView(sections_page)
+        self.sections_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.sections_view.setSelectionMode(QListView.NoSelection)
+        self.sections_view.setResizeMode(QListView.Adjust)  # re-wrap on resize
+        self.sections_view.setSpacing(9)  # 18 px between cards
+        self._doc_card_model = DocCardModel(self)
+        self.sections_view.setModel(self._doc_card_model)
+        self.sections_view.setItemDelegate(DocCardDelegate(self.sections_view))
+        sections_layout.addWidget(self.sections_view, 1)
 
         self.stack.addWidget(sections_page)
 
@@ -194,15 +243,26 @@ class SelectedGeneCardsWidget(QWidget):
         self._proxy = GeneProxy(self)
         self._proxy.setSourceModel(self._model)
         self.list_view.setModel(self._proxy)
-        self._delegate = NarrowGeneDelegate(
-            self.header_mode.currentText, self.list_view)
+        self._delegate = NarrowGeneDelegate(self.list_view)
         self.list_view.setItemDelegate(self._delegate)
 
+        # filter debouncing
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(
+            lambda: self._proxy.set_query(self.search_edit.text()))
+        self.sections_filter_timer = QTimer(self)
+        self.sections_filter_timer.setSingleShot(True)
+        self.sections_filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.sections_filter_timer.timeout.connect(self._filter_section_cards)
+
         # Wire
         self.header_mode.currentTextChanged.connect(
             lambda _: self._proxy.set_header_mode(self.header_mode.currentText()))
         self.sort_combo.currentTextChanged.connect(self._proxy.set_sort_mode)
-        self.search_edit.textChanged.connect(self._proxy.setFilterRegExp)
+        self.search_edit.textChanged.connect(
+            lambda _text: self.search_timer.start())
         self.deep_search.toggled.connect(self._proxy.set_deep_search)
         self.list_view.clicked.connect(self._open_detail)
         self.back_btn.clicked.connect(lambda: self.stack.setCurrentIndex(0))
@@ -213,8 +273,9 @@ class SelectedGeneCardsWidget(QWidget):
         self.back_from_sections_btn.clicked.connect(
             lambda: self.stack.setCurrentIndex(1))
         self.sections_search_edit.textChanged.connect(
-            self._filter_section_cards)
-        self.pmid_filter_edit.textChanged.connect(self._filter_section_cards)
+            lambda _text: self.sections_filter_timer.start())
+        self.pmid_filter_edit.textChanged.connect(
+            lambda _text: self.sections_filter_timer.start())
 
         # Init
         self._proxy.set_sort_mode(self.sort_combo.currentText())
@@ -240,13 +301,19 @@ class SelectedGeneCardsWidget(QWidget):
             db_path: path to the sqlite3 database(enables sections page)
         """
         self._data: list[dict] = genes or []
-        if db_path is not None:
+        if db_path is not None and str(db_path) != self._db_path:
+            self._close_sections_conn()
             self._db_path = str(db_path)
         self._model.update(self._data)
         self._proxy.invalidate()
         self._proxy.set_sort_mode(self.sort_combo.currentText())
         self._refresh_stats_and_title()
 
+    def closeEvent(self, event) -> None:
+        """Close the sections database connection with the widget."""
+        self._close_sections_conn()
+        super().closeEvent(event)
+
     # ---- Internals: chips & stats ----
     def _make_chip(self, label: str, value: str) -> QFrame:
         """ Create a stat chip with label and value.
@@ -293,25 +360,25 @@ class SelectedGeneCardsWidget(QWidget):
         d: list[dict] = self._data or []
         n = len(d)
         self.title_label.setText(f"{n} Genes" if n else "No Genes")
-        total_ann = sum(int(x.get("annotations", 0) or 0) for x in d)
-        taxa = set(str(x.get("tax_id", "") or "")
-                   for x in d if x.get("tax_id"))
-        ann_counts = sorted([int(x.get("annotations", 0) or 0) for x in d])
-        if not ann_counts:
+        ann = self._model.ann_array()  # annotation counts, aligned with d
+        total_ann = int(ann.sum())
+        if not len(ann):
             median_value = 0
         else:
-            n = len(ann_counts)
-            mid = n // 2
-            median_value = ann_counts[mid] if n % 2 else (
-                ann_counts[mid - 1] + ann_counts[mid]) / 2
-
-        top = max(d, key=lambda x: int(
-            x.get("annotations", 0) or 0), default=None)
+            # partial sort: only the middle element(s) need their sorted position
+            mid = len(ann) // 2
+            if len(ann) % 2:
+                median_value = int(np.partition(ann, mid)[mid])
+            else:
+                lower, upper = np.partition(ann, (mid - 1, mid))[mid - 1:mid + 1]
+                median_value = (int(lower) + int(upper)) / 2
+
+        top = d[int(ann.argmax())] if len(ann) else None
         top_gene = (top.get("gene_symbol") or top.get(
             "entrez_id")) if top else "-"
         self._set_chip("Genes", n)
         self._set_chip("Ann.", total_ann)
-        self._set_chip("Taxa", len(taxa))
+        self._set_chip("Taxa", self._model.tax_count())
         self._set_chip("Median", f"{median_value:.1f}" if isinstance(
             median_value, float) else str(median_value))
         self._set_chip("Top", top_gene)
@@ -319,8 +386,9 @@ class SelectedGeneCardsWidget(QWidget):
     # ---- Detail page ----
     def _clear_detail(self) -> None:
         """ Clear the detail layout of previous widgets. """
+        # take items from the end, so the layout never shifts the remaining ones
         while self.detail_layout.count():
-            it = self.detail_layout.takeAt(0)
+            it = self.detail_layout.takeAt(self.detail_layout.count() - 1)
             w = it.widget()
             if w:
                 w.deleteLater()
@@ -365,106 +433,60 @@ class SelectedGeneCardsWidget(QWidget):
 
         grouped = self._fetch_sections_grouped_for_gene(self._current_gene)
         self._last_grouped_sections = grouped  # cache for live filtering
-        self.sections_search_edit.clear()
-        self.pmid_filter_edit.clear()
+        for edit in (self.sections_search_edit, self.pmid_filter_edit):
+            edit.blockSignals(True)  # the cards are filtered once they are built
+            edit.clear()
+            edit.blockSignals(False)
         self._render_section_cards(grouped)
         self.stack.setCurrentIndex(2)
 
     def _filter_section_cards(self) -> None:
-        """ Re-render section cards based on current filter inputs. """
-        if not self._last_grouped_sections:
-            return
-        self._render_section_cards(self._last_grouped_sections)
-
-    def _clear_section_cards(self) -> None:
-        """ Clear all section cards from the layout except the final stretch. """
-        while self.sections_cards_layout.count() > 1:  # keep the final stretch
-            it = self.sections_cards_layout.takeAt(0)
-            w = it.widget()
-            if w:
-                w.deleteLater()
+        """ Show only the section cards and sections matching the current filter inputs. """
+        self.sections_filter_timer.stop()
+        self._doc_card_model.set_filter(
+            (self.sections_search_edit.text() or "").lower().strip(),
+            (self.pmid_filter_edit.text() or "").strip())
 
     def _render_section_cards(self, grouped: dict) -> None:
-        """ Render section cards based on grouped data and current filters.
+        """ Show the document cards of grouped data and apply the filters.
 
         Args:
             grouped: dict returned by _fetch_sections_grouped_for_gene
         """
-        self._clear_section_cards()
-
         # summary
         self._set_pchip("Docs", grouped["summary"]["n_documents"])
         self._set_pchip("Unique Sections",
                         grouped["summary"]["n_unique_sections"])
         self._set_pchip("Mentions", grouped["summary"]["total_mentions"])
 
-        q = (self.sections_search_edit.text() or "").lower().strip()
-        pmid_filter = (self.pmid_filter_edit.text() or "").strip()
-
-        # Each document card
-        for doc in grouped["docs"]:
-            if pmid_filter and doc["pubmed_id"] != pmid_filter:
-                continue
-
-            # Filter sections by search query
-            def match_section(p, d):
-                if not q:
-                    return True
-                hay = " ".join([
-                    d.get("title", ""),
-                    str(d.get("pubmed_id", "")),
-                    p.get("section_type", ""),
-                    p.get("type", ""),
-                    p.get("section_text", "")
-                ]).lower()
-                return q in hay
-
-            filtered_sections = [
-                p for p in doc["sections"] if match_section(p, doc)]
-            if not filtered_sections:
-                continue
-
-            # Document card
-            card = QFrame(self.sections_container)
-            card.setObjectName("DocCard")
-            '''card.setStyleSheet(
-                """QFrame  # DocCard { border: 1px solid palette(mid);
-                border-radius: 8px; background: palette(base); }""")'''
-            cl = QVBoxLayout(card)
-            cl.setContentsMargins(12, 12, 12, 12)
-            cl.setSpacing(12)
-
-            header = QLabel(f"<b>PMID {doc['pubmed_id']}</b> — {doc['title'] or '(no title)'} "
-                            f"<span style='color:gray'>• {doc['total_mentions']} mentions</span>")
-            header.setTextFormat(Qt.RichText)
-            cl.addWidget(header)
-
-            # Each unique section ordered
-            for p in filtered_sections:
-                row = QFrame(card)
-                rl = QVBoxLayout(row)
-                rl.setContentsMargins(8, 8, 8, 8)
-                rl.setSpacing(6)
-
-                meta = QLabel(
-                    f"s{p['section_number']} ({p['section_type'] or p['type']}): <b>{p['count']}x</b>")
-                meta.setTextFormat(Qt.RichText)
-                rl.addWidget(meta)
-
-                body = QLabel(p['section_text'])
-                body.setWordWrap(True)
-                rl.addWidget(body)
-
-                # soft divider
-                sub = QFrame(card)
-                sub.setFrameShape(QFrame.HLine)
-                sub.setFrameShadow(QFrame.Sunken)
-                rl.addWidget(sub)
-
-                cl.addWidget(row)
-
-            self.sections_cards_layout.insertWidget(
-                self.sections_cards_layout.count()-1, card)
+        self._doc_card_model.set_docs(grouped["docs"])
+        self._filter_section_cards()
+        self.sections_view.scrollToTop()
+
+    def _sections_conn(self) -> sqlite3.Connection:
+        """ Return the read-only connection to the project database, opening it once.
+
+        The database is opened with mode=ro, so the viewer never writes to it
+        (its indexes come from the database layer, see SECTIONS_INDEXES in
+        app.database.database_creation).
+
+        Returns:
+            sqlite3.Connection: Connection to self._db_path.
+        """
+        if self._db_conn is None:
+            db_uri = Path(self._db_path).resolve().as_uri()
+            conn = sqlite3.connect(f"{db_uri}?mode=ro", uri=True,
+                                   check_same_thread=False)
+            for pragma in SECTIONS_DB_PRAGMAS:
+                conn.execute(pragma)
+            self._db_conn = conn
+        return self._db_conn
+
+    def _close_sections_conn(self) -> None:
+        """ Close the sections database connection, if open. """
+        if self._db_conn is not None:
+            self._db_conn.close()
+            self._db_conn = None
 
     def _fetch_sections_grouped_for_gene(self, gene: dict) -> dict:
         """
@@ -482,7 +504,8 @@ class SelectedGeneCardsWidget(QWidget):
               "total_mentions": 7,
               "sections": [
                 {"section_number": 1, "section_type": "ABSTRACT", "type": "abstract",
-                 "section_text": "full text ...", "count": 3},
+                 "section_text": "full text ...", "count": 3,
+                 "_haystack": "title... 12345 abstract abstract full text ..."},
                 ...
               ]
             },
@@ -500,59 +523,52 @@ class SelectedGeneCardsWidget(QWidget):
         entrez = (gene.get("entrez_id") or "").strip()
         accs = sorted({a.get("accession") for a in (
             gene.get("annotation_list") or []) if a.get("accession")})
-        base = """
-            SELECT a.pubmed_id, ar.title,
-                   a.passage_number, p.section_type, p.type, p.passage_text,
-                   COUNT(*) as mention_count
-            FROM annotations a
-            JOIN passages p ON a.pubmed_id = p.pubmed_id AND a.passage_number = p.passage_number
-            LEFT JOIN articles ar ON ar.pubmed_id = a.pubmed_id
-            WHERE {COND}
-            GROUP BY a.pubmed_id, a.passage_number
-            ORDER BY a.pubmed_id, a.passage_number
-        """
+        sym = (gene.get("gene_symbol") or "").strip()
+
+        # results are reused until the database file is replaced or written to
+        try:
+            stamp = (self._db_path, os.path.getmtime(self._db_path))
+        except OSError:
+            stamp = None
+        if stamp != self._sections_cache_stamp:
+            self._sections_cache.clear()
+            self._sections_cache_stamp = stamp
+        key = (entrez, tuple(accs), sym)
+        grouped = self._sections_cache.get(key)
+        if grouped is not None:
+            self._sections_cache.move_to_end(key)
+            return grouped
+
         rows: list[tuple] = []
+        failed = False
         try:
-            conn = sqlite3.connect(self._db_path)
-            cur = conn.cursor()
+            conn = self._sections_conn()
 
             # Fast path: by numeric entity_id (preferred)
             if entrez and entrez.isdigit():
-                cur.execute(base.format(COND="a.entity_id = ?"), (entrez,))
-                rows = cur.fetchall()
+                rows = conn.execute(SECTIONS_BY_ENTITY_SQL, (entrez,)).fetchall()
 
-            # Fallback: by accession(s)
+            # Fallback: by accession(s), bound as one JSON array
             if (not rows) and accs:
-                q = base.format(COND="a.accession IN ({})".format(
-                    ",".join(["?"]*len(accs))))
-                cur.execute(q, tuple(accs))
-                rows = cur.fetchall()
+                rows = conn.execute(SECTIONS_BY_ACCESSIONS_SQL,
+                                    (orjson.dumps(accs).decode(),)).fetchall()
 
             # Last resort: by symbol via entities join
-            if not rows:
-                sym = (gene.get("gene_symbol") or "").strip()
-                if sym:
-                    q = base.replace(
-                        "WHERE {COND}",
-                        """WHERE a.entity_id IN (
-                        SELECT e.entity_id FROM entities e 
-                        WHERE e.biotype='gene' 
-                        AND (e.name=? OR e.accession=?)
-                        )
-                        """
-                    )
-                    cur.execute(q, (sym, f"@GENE_{sym}"))
-                    rows = cur.fetchall()
-
-            conn.close()
+            if not rows and sym:
+                rows = conn.execute(SECTIONS_BY_SYMBOL_SQL,
+                                    (sym, f"@GENE_{sym}")).fetchall()
         except sqlite3.Error as e:
             print(f"[Sections grouped query error] {e}")
             rows: list[tuple] = []
+            failed = True
 
-        # Build doc → sections and summary
+        # Build doc → sections and summary; rows arrive ordered by PMID and
+        # passage number (ORDER BY in SECTIONS_QUERY_TEMPLATE), so documents and
+        # their sections are already in display order
         docs_map: dict[str, dict] = {}
         total_mentions = 0
         for (pmid, title, pno, sec, typ, ptxt, cnt) in rows:
+            count = int(cnt or 0)
             d = docs_map.setdefault(str(pmid), {
                 "pubmed_id": str(pmid),
                 "title": title or "",
@@ -564,20 +580,18 @@ class SelectedGeneCardsWidget(QWidget):
                 "section_type": sec or "",
                 "type": typ or "",
                 "section_text": ptxt or "",
-                "count": int(cnt or 0)
+                "count": count,
+                # lowercase text searched by the section filter
+                "_haystack": f"{title or ''} {pmid} {sec or ''} {typ or ''} {ptxt or ''}".lower()
             })
-            d["total_mentions"] += int(cnt or 0)
-            total_mentions += int(cnt or 0)
-
-        for d in docs_map.values():
-            d["sections"].sort(key=lambda x: (
-                x["section_number"] if x["section_number"] is not None else 10**9))
+            d["total_mentions"] += count
+            total_mentions += count
 
-        docs = sorted(docs_map.values(), key=lambda d: d["pubmed_id"])
+        docs = list(docs_map.values())
         n_docs = len(docs)
         n_unique_sections = sum(len(d["sections"]) for d in docs)
 
-        return {
+        grouped = {
             "summary": {
                 "n_documents": n_docs,
                 "n_unique_sections": n_unique_sections,
@@ -585,42 +599,39 @@ class SelectedGeneCardsWidget(QWidget):
             },
             "docs": docs
         }
+        if not failed and stamp is not None:
+            self._sections_cache[key] = grouped
+            if len(self._sections_cache) > SECTIONS_CACHE_SIZE:
+                self._sections_cache.popitem(last=False)
+        return grouped
 
 
 # --- Helper Functions ---
-def build_annotation_table(parent: QWidget, ann_list: list[dict]) -> QTableWidget:
-    """ Build a QTableWidget for the given annotation list.
+def build_annotation_table(parent: QWidget, ann_list: list[dict]) -> QTableView:
+    """ Build a QTableView for the given annotation list.
 
     Args:
         parent: Parent QWidget.
         ann_list: List of annotation dicts.
     Returns:
-        QTableWidget populated with annotation data.
+        QTableView showing the annotation data (see AnnotationTableModel).
     """
-    cols = ["text", "accession", "pubmed_id",
-            "section_number", "offset_start", "length", "tax_id"]
-    t = QTableWidget(len(ann_list), len(cols), parent)
-    t.setHorizontalHeaderLabels([c.replace("_", " ").title() for c in cols])
+    t = QTableView(parent)
+    t.setModel(AnnotationTableModel(ann_list, t))
     t.verticalHeader().setVisible(False)
-    t.setEditTriggers(QTableWidget.NoEditTriggers)
-    t.setSelectionBehavior(QTableWidget.SelectRows)
-    t.setSelectionMode(QTableWidget.SingleSelection)
+    # fixed row height, so the view never measures rows it does not show
+    t.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    t.verticalHeader().setDefaultSectionSize(t.fontMetrics().height() + 8)
+    t.setEditTriggers(QTableView.NoEditTriggers)
+    t.setSelectionBehavior(QTableView.SelectRows)
+    t.setSelectionMode(QTableView.SingleSelection)
     t.setAlternatingRowColors(True)
     t.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-    for r, item in enumerate(ann_list):
-        for c, key in enumerate(cols):
-
-            val = item.get(key)
-            if key == "section_number" and val is None:
-                val = item.get("passage_number")
-
-            it = QTableWidgetItem("" if val is None else str(val))
-            if key in {"section_number", "offset_start", "length"}:
-                it.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            t.setItem(r, c, it)
-
+    # column widths are measured on the first rows only
+    header = t.horizontalHeader()
+    header.setResizeContentsPrecision(ANNOTATION_RESIZE_SAMPLE_ROWS)
     t.resizeColumnsToContents()
-    t.horizontalHeader().setStretchLastSection(True)
+    header.setStretchLastSection(True)
     t.setMinimumHeight(280)
     return t
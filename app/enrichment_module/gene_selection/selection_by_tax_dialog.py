@@ -4,7 +4,6 @@
 from PyQt5.QtWidgets import (
     QDialog,
     QListWidget,
-    QListWidgetItem,
     QPushButton,
     QVBoxLayout,
 )
@@ -31,9 +30,8 @@ class TaxIdSelectionDialog(QDialog):
         self.list_widget = QListWidget()
         self.list_widget.setSelectionMode(QListWidget.MultiSelection)
 
-        for tax_id in sorted(set(tax_id_list)):  # Unique and sorted tax IDs
-            item = QListWidgetItem(str(tax_id))
-            self.list_widget.addItem(item)
+        # unique and sorted tax IDs, added in one call instead of one item at a time
+        self.list_widget.addItems(sorted({str(tax_id) for tax_id in tax_id_list}))
 
         layout.addWidget(self.list_widget)
 
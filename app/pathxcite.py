@@ -52,6 +52,7 @@ from app.utils import get_default_html_svg, resource_path
 from app.web_utils.profile_creator import WebEngineRegistry
 from app.workers.article_retrieval_worker import ArticleRetrievalWorker
 from app.workers.enrichment_worker import EnrichmentWorker
+from app.workers.sections_index_worker import SectionsIndexWorker
 
 
 class PathXCite(QWidget):
@@ -394,6 +395,37 @@ class PathXCite(QWidget):
                 self.valid_databases[db_path] = validation_result.get(
                     "numberArticles", 0)
 
+        self._add_sections_indexes(list(self.valid_databases))
+
+    def _add_sections_indexes(self, db_paths: list[str]) -> None:
+        """Add the missing gene sections indexes to the databases in a worker thread.
+
+        Databases created before these indexes existed do not have them, and the
+        gene sections viewer only reads the database.
+
+        Args:
+            db_paths (list[str]): Paths of the valid databases.
+        """
+        if not db_paths:
+            return
+        worker = SectionsIndexWorker("Sections indexes", db_paths)
+        # keep a reference so the worker's signals outlive this call
+        self._sections_index_worker = worker
+        worker.signals.error.connect(lambda _tid, msg: self.add_log_line(
+            f"Adding sections indexes failed for {msg}", mode="ERROR"))
+        worker.signals.finished.connect(self._on_sections_indexes_added)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_sections_indexes_added(self, _task_id: str, updated: dict) -> None:
+        """Log the databases that received new sections indexes.
+
+        Args:
+            _task_id (str): The ID of the indexing task.
+            updated (dict): Database path -> names of the created indexes.
+        """
+        for db_path, names in updated.items():
+            self.add_log_line(f"Added sections indexes to {db_path}: {', '.join(names)}")
+
     # === Database Utils === #
     def add_new_database(self) -> None:
         """Prompt user to create a new database."""
@@ -3,6 +3,7 @@
 # --- Standard Library Imports ---
 import re
 import sys
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
 
@@ -70,11 +71,15 @@ def dataframe_to_tsv(df: pd.DataFrame) -> str:
     return output.getvalue()
 
 
+@lru_cache(maxsize=32)
 def get_default_html_svg(icon_abs_path: str, width=35, height=35,
                          message: str = "Please start enrichment process to get insights into enriched pathways.") -> str:
     """
     Generate an HTML string for QWebEngineView with a local SVG icon.
 
+    The page is cached per argument combination, so the SVG file is only
+    read once per icon and message.
+
     Args: 
         icon_abs_path (str): OS-specific absolute path to the SVG file (e.g. from resource_path()).
         message (str): Message text to display under the icon.
@@ -82,7 +87,8 @@ def get_default_html_svg(icon_abs_path: str, width=35, height=35,
     Returns:
         str: HTML string containing the SVG icon and message.
     """
-    svg_content = open(icon_abs_path, encoding="utf-8").read()
+    with open(icon_abs_path, encoding="utf-8") as file:
+        svg_content = file.read()
 
     return f"""
     <!DOCTYPE html>
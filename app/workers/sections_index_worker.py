@@ -0,0 +1,41 @@
+"""Worker for adding the gene sections indexes to existing databases"""
+
+# --- Third Party Imports ---
+from PyQt5.QtCore import QRunnable
+
+# --- Local Imports ---
+from app.database.database_creation import add_sections_indexes
+from app.workers.signals import WorkerSignals
+
+# --- Public Classes ---
+
+
+class SectionsIndexWorker(QRunnable):
+    """Worker to add the missing gene sections indexes to existing databases.
+
+    Runs off the UI thread: building an index over a large annotations table
+    can take a while, and the gene sections viewer opens the database read-only.
+    """
+
+    def __init__(self, task_name, db_paths):
+        super().__init__()
+        self.task_name = task_name
+        self.db_paths = list(db_paths)
+
+        self.signals = WorkerSignals()
+
+    # --- Public Functions ---
+    def run(self):
+        """Add the missing indexes to each database; a failing database does not stop the others."""
+        updated = {}
+        for db_path in self.db_paths:
+            try:
+                created = add_sections_indexes(db_path)
+            except Exception as e:
+                self.signals.error.emit(self.task_name, f"{db_path}: {e}")
+                continue
+            if created:
+                updated[db_path] = created
+
+        # payload: db path -> names of the created indexes
+        self.signals.finished.emit(self.task_name, updated)
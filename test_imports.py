@@ -32,6 +32,7 @@ import xml.etree.ElementTree as ET
 
 # put in requirements
 import numpy as np
+import orjson
 import pandas as pd
 import requests
 from scipy.stats import fisher_exact, hypergeom
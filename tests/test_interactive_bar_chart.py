@@ -0,0 +1,58 @@
+"""Tests choosing between the Plotly and the Vega-Lite bar chart pages"""
+
+# --- Third Party Imports ---
+import numpy as np
+import pandas as pd
+
+# --- Local Imports ---
+from app.enrichment_module.enrichment_results.interactive_plot_creation import (
+    VEGALITE_BAR_CHART_MIN_ROWS,
+    generate_interactive_bar_chart_html_async
+)
+
+PLOTLY_SCRIPT = "https://cdn.plot.ly/plotly-basic-2.35.2.min.js"
+VEGA_SCRIPTS = (
+    "https://cdn.jsdelivr.net/npm/vega@5.30.0",
+    "https://cdn.jsdelivr.net/npm/vega-lite@5.21.0",
+    "https://cdn.jsdelivr.net/npm/vega-embed@6.26.0",
+)
+
+
+# --- Private Functions ---
+def _results(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Term": [f"term {i} </script>" for i in range(n)],
+        "Overlap Ratio": rng.random(n),
+        "-log10 P-value": rng.random(n) * 10,
+        "-log10 Adjusted P-value": rng.random(n) * 8,
+    })
+
+
+def _bar_chart_page(tmp_path, df: pd.DataFrame, **kwargs) -> str:
+    output_file = tmp_path / "bar_chart.html"
+    generate_interactive_bar_chart_html_async(
+        df, output_file=str(output_file), **kwargs).result(timeout=60)
+    return output_file.read_text(encoding="utf-8")
+
+
+# --- Tests ---
+def test_small_table_uses_plotly(tmp_path):
+    page = _bar_chart_page(tmp_path, _results(10))
+    assert PLOTLY_SCRIPT in page
+    assert "vegaEmbed" not in page
+
+
+def test_large_table_uses_vegalite(tmp_path):
+    page = _bar_chart_page(tmp_path, _results(VEGALITE_BAR_CHART_MIN_ROWS))
+    assert "plotly" not in page
+    assert all(f'<script src="{src}"></script>' in page for src in VEGA_SCRIPTS)
+    # the spec is embedded once; term names cannot close its script element
+    assert page.count("</script>") == len(VEGA_SCRIPTS) + 1
+
+
+def test_lightweight_flag_overrides_row_count(tmp_path):
+    assert "vegaEmbed" in _bar_chart_page(tmp_path, _results(10), lightweight=True)
+    page = _bar_chart_page(tmp_path, _results(VEGALITE_BAR_CHART_MIN_ROWS),
+                           lightweight=False)
+    assert PLOTLY_SCRIPT in page
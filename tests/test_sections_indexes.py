@@ -0,0 +1,73 @@
+"""Tests adding the gene sections indexes to existing databases"""
+
+# --- Standard Library Imports ---
+import os
+import sqlite3
+
+# --- Third Party Imports ---
+import pytest
+
+# --- Local Imports ---
+from app.database.database_creation import (
+    SECTIONS_INDEXES,
+    add_sections_indexes,
+    create_database
+)
+
+
+# --- Private Functions ---
+def _index_names(db_path) -> set[str]:
+    with sqlite3.connect(db_path) as conn:
+        return {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+def _old_database(tmp_path):
+    """Create a database as it was before the sections indexes existed."""
+    db_path = str(tmp_path / "project.db")
+    create_database(db_path)
+    with sqlite3.connect(db_path) as conn:
+        for name in SECTIONS_INDEXES:
+            conn.execute(f"DROP INDEX {name}")
+    assert not _index_names(db_path) & set(SECTIONS_INDEXES)
+    return db_path
+
+
+# --- Tests ---
+def test_new_database_has_sections_indexes(tmp_path):
+    db_path = str(tmp_path / "project.db")
+    create_database(db_path)
+    assert set(SECTIONS_INDEXES) <= _index_names(db_path)
+
+
+def test_existing_database_gets_sections_indexes(tmp_path):
+    db_path = _old_database(tmp_path)
+
+    created = add_sections_indexes(db_path)
+
+    assert sorted(created) == sorted(SECTIONS_INDEXES)
+    assert set(SECTIONS_INDEXES) <= _index_names(db_path)
+
+
+def test_indexed_database_is_not_written(tmp_path):
+    db_path = str(tmp_path / "project.db")
+    create_database(db_path)
+    os.utime(db_path, ns=(0, 0))
+
+    assert add_sections_indexes(db_path) == []
+    assert os.stat(db_path).st_mtime_ns == 0
+
+
+def test_worker_adds_sections_indexes(tmp_path):
+    pytest.importorskip("PyQt5.QtCore")
+    from app.workers.sections_index_worker import SectionsIndexWorker
+
+    db_path = _old_database(tmp_path)
+    worker = SectionsIndexWorker("Sections indexes", [db_path])
+    finished = []
+    worker.signals.finished.connect(lambda _tid, updated: finished.append(updated))
+
+    worker.run()
+
+    assert set(SECTIONS_INDEXES) <= _index_names(db_path)
+    assert list(finished[0]) == [db_path]